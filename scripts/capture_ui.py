@@ -3,49 +3,260 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import pathlib
 import sys
-import time
+import tempfile
+from typing import Iterable
+from urllib.parse import urlsplit
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import BrowserContext, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 DEFAULT_URL = "http://localhost:8000/"
 DEFAULT_OUT = pathlib.Path("docs/images/remy-ui.png")
 DEFAULT_VIEWPORT = (1600, 900)
 DEFAULT_DELAY = 2.0
-DEFAULT_SCALE = 1.5
+DEFAULT_SETTLE_MS = 300
+DEFAULT_SCALE = 1.0
+DEFAULT_JPEG_QUALITY = 85
+JPEG_SUFFIXES = {".jpg", ".jpeg"}
+DEFAULT_CONCURRENCY = 4
+DEFAULT_BROWSERS = 1
+EXTERNAL_ASSET_TYPES = {"font", "media"}
+DEFAULT_USER_DATA_DIR = pathlib.Path(tempfile.gettempdir()) / "remy-ui-cache"
 
 
-def capture(
+async def _capture_one(
+    context: BrowserContext,
     url: str,
     output: pathlib.Path,
+    delay: float,
+    full_page: bool,
+    settle_ms: int,
+    quality: int,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    async with semaphore:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        page = await context.new_page()
+        try:
+            await page.goto(url, wait_until="load")
+            try:
+                # Bounded idle wait: stragglers (polling, analytics) shouldn't stall the capture.
+                await page.wait_for_load_state("networkidle", timeout=int(delay * 1000))
+            except PlaywrightTimeoutError:
+                pass
+            if settle_ms > 0:
+                await page.wait_for_timeout(settle_ms)
+            if output.suffix.lower() in JPEG_SUFFIXES:
+                # Lossy encode is several times cheaper than PNG for the same pixel count.
+                await page.screenshot(path=str(output), full_page=full_page, type="jpeg", quality=quality)
+            else:
+                await page.screenshot(path=str(output), full_page=full_page)
+        finally:
+            await page.close()
+
+
+def _host_matches(host: str, patterns: frozenset[str]) -> bool:
+    return any(host == pattern or host.endswith(f".{pattern}") for pattern in patterns)
+
+
+async def _install_request_filter(
+    context: BrowserContext,
+    local_hosts: frozenset[str],
+    block_hosts: frozenset[str],
+    block_external_assets: bool,
+) -> None:
+    """Abort requests that only keep the network busy (analytics, third-party fonts/media)."""
+
+    async def _handle(route: Route) -> None:
+        request = route.request
+        host = urlsplit(request.url).hostname or ""
+        if _host_matches(host, block_hosts) or (
+            block_external_assets and request.resource_type in EXTERNAL_ASSET_TYPES and host not in local_hosts
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", _handle)
+
+
+async def _capture_many_async(
+    targets: list[tuple[str, pathlib.Path]],
     viewport: tuple[int, int],
     delay: float,
     scale: float,
     full_page: bool,
+    settle_ms: int,
+    quality: int,
+    concurrency: int,
+    browsers: int,
+    user_data_dir: pathlib.Path,
+    block_hosts: frozenset[str],
+    block_external_assets: bool,
 ) -> None:
-    output.parent.mkdir(parents=True, exist_ok=True)
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch()
-        context = browser.new_context(
-            viewport={"width": viewport[0], "height": viewport[1]},
-            device_scale_factor=scale,
+    local_hosts = frozenset(urlsplit(url).hostname or "" for url, _ in targets)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    async with async_playwright() as playwright:
+        # Screenshot rasterization serializes per browser process, so spread pages over a small pool.
+        # Persistent profiles keep Chromium's HTTP/code caches warm across script invocations;
+        # each process needs its own directory because Chromium locks the profile.
+        contexts: list[BrowserContext] = []
+        try:
+            for index in range(max(1, min(browsers, len(targets)))):
+                contexts.append(
+                    await playwright.chromium.launch_persistent_context(
+                        user_data_dir=str(user_data_dir / f"profile-{index}"),
+                        viewport={"width": viewport[0], "height": viewport[1]},
+                        device_scale_factor=scale,
+                    )
+                )
+                if block_hosts or block_external_assets:
+                    await _install_request_filter(contexts[-1], local_hosts, block_hosts, block_external_assets)
+            await asyncio.gather(
+                *(
+                    _capture_one(
+                        contexts[index % len(contexts)], url, output, delay, full_page, settle_ms, quality, semaphore
+                    )
+                    for index, (url, output) in enumerate(targets)
+                )
+            )
+        finally:
+            for context in contexts:
+                await context.close()
+
+
+def capture_many(
+    targets: Iterable[tuple[str, pathlib.Path]],
+    viewport: tuple[int, int],
+    delay: float,
+    scale: float,
+    full_page: bool,
+    settle_ms: int = DEFAULT_SETTLE_MS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    browsers: int = DEFAULT_BROWSERS,
+    quality: int = DEFAULT_JPEG_QUALITY,
+    user_data_dir: pathlib.Path = DEFAULT_USER_DATA_DIR,
+    block_hosts: Iterable[str] = (),
+    block_external_assets: bool = False,
+) -> None:
+    """Capture each ``(url, output)`` pair, navigating up to ``concurrency`` pages at once."""
+
+    targets = list(targets)
+    if not targets:
+        return
+    asyncio.run(
+        _capture_many_async(
+            targets,
+            viewport,
+            delay,
+            scale,
+            full_page,
+            settle_ms,
+            quality,
+            concurrency,
+            browsers,
+            user_data_dir,
+            frozenset(host.strip().lower() for host in block_hosts if host.strip()),
+            block_external_assets,
         )
-        page = context.new_page()
-        page.goto(url, wait_until="networkidle")
-        time.sleep(delay)
-        page.screenshot(path=str(output), full_page=full_page)
-        browser.close()
+    )
+
+
+def capture(
+    url: str,
+    output: pathlib.Path,
+    viewport: tuple[int, int],
+    delay: float,
+    scale: float,
+    full_page: bool,
+    settle_ms: int = DEFAULT_SETTLE_MS,
+) -> None:
+    capture_many([(url, output)], viewport, delay, scale, full_page, settle_ms)
+
+
+def _read_targets(path: pathlib.Path) -> list[tuple[str, pathlib.Path]]:
+    """Parse newline-separated ``URL<TAB>OUTPUT`` pairs, skipping blanks and ``#`` comments."""
+
+    targets: list[tuple[str, pathlib.Path]] = []
+    for lineno, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        url, sep, output = line.partition("\t")
+        if not sep or not url.strip() or not output.strip():
+            raise ValueError(f"{path}:{lineno}: expected 'URL<TAB>OUTPUT'")
+        targets.append((url.strip(), pathlib.Path(output.strip())))
+    return targets
 
 
 def main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(description="Capture Remy UI screenshot")
     parser.add_argument("--url", default=DEFAULT_URL, help="Base URL of the running Remy UI")
     parser.add_argument("--output", type=pathlib.Path, default=DEFAULT_OUT, help="Output PNG path")
+    parser.add_argument(
+        "--urls-file",
+        type=pathlib.Path,
+        help="Capture every 'URL<TAB>OUTPUT' line in this file (overrides --url/--output)",
+    )
     parser.add_argument("--width", type=int, default=DEFAULT_VIEWPORT[0], help="Viewport width")
     parser.add_argument("--height", type=int, default=DEFAULT_VIEWPORT[1], help="Viewport height")
-    parser.add_argument("--delay", type=float, default=DEFAULT_DELAY, help="Seconds to wait after load")
-    parser.add_argument("--scale", type=float, default=DEFAULT_SCALE, help="Device scale factor")
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=DEFAULT_DELAY,
+        help="Maximum seconds to wait for network idle after load",
+    )
+    parser.add_argument(
+        "--settle-ms",
+        type=int,
+        default=DEFAULT_SETTLE_MS,
+        help="Extra milliseconds for fonts/CSS to paint before capturing (0 disables)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=DEFAULT_SCALE,
+        help="Device scale factor (raster cost grows with its square; use 1.5+ only for hero images)",
+    )
+    parser.add_argument(
+        "--quality",
+        type=int,
+        default=DEFAULT_JPEG_QUALITY,
+        help="JPEG quality when the output ends in .jpg/.jpeg (PNG outputs stay lossless)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum pages navigating at once in batch mode",
+    )
+    parser.add_argument(
+        "--browsers",
+        type=int,
+        default=DEFAULT_BROWSERS,
+        help="Chromium processes to round-robin pages across (parallelizes screenshot raster)",
+    )
+    parser.add_argument(
+        "--user-data-dir",
+        type=pathlib.Path,
+        default=DEFAULT_USER_DATA_DIR,
+        help="Chromium profile directory reused across runs for a warm cache (persist it in CI)",
+    )
+    parser.add_argument(
+        "--block-hosts",
+        nargs="*",
+        default=[],
+        metavar="HOST",
+        help="Abort requests to these hosts and their subdomains (e.g. analytics)",
+    )
+    parser.add_argument(
+        "--block-external-assets",
+        action="store_true",
+        help="Abort font/media requests to hosts other than the captured URLs",
+    )
     parser.add_argument(
         "--full-page",
         action="store_true",
@@ -53,15 +264,30 @@ def main(argv: list[str]) -> int:
     )
     args = parser.parse_args(argv)
 
-    capture(
-        args.url,
-        args.output,
+    if args.urls_file is not None:
+        try:
+            targets = _read_targets(args.urls_file)
+        except (OSError, ValueError) as exc:
+            parser.error(str(exc))
+    else:
+        targets = [(args.url, args.output)]
+
+    capture_many(
+        targets,
         (args.width, args.height),
         args.delay,
         args.scale,
         args.full_page,
+        args.settle_ms,
+        args.concurrency,
+        args.browsers,
+        args.quality,
+        args.user_data_dir,
+        args.block_hosts,
+        args.block_external_assets,
     )
-    print(f"Saved screenshot to {args.output}")
+    for _, output in targets:
+        print(f"Saved screenshot to {output}")
     return 0
 
 
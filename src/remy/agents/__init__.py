@@ -1,14 +1,36 @@
-"""Agent implementations for the Remy dinner planner."""
-
-from remy.agents.approvals_orchestrator import ApprovalsOrchestrator
-from remy.agents.base import Agent
-from remy.agents.context_assembler import ContextAssembler
-from remy.agents.diff_validator import DiffValidator
-from remy.agents.menu_planner import MenuPlanner
-from remy.agents.notifier import Notifier
-from remy.agents.nutrition_estimator import NutritionEstimator
-from remy.agents.receipt_ingestor import ReceiptIngestor
-from remy.agents.shopping_dispatcher import ShoppingDispatcher
+"""Agent implementations for the Remy dinner planner.
+
+Agents are imported lazily (PEP 562) so ``import remy.agents`` does not pull in the
+planner, OCR, and settings stacks until a specific agent is requested.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from remy.agents.approvals_orchestrator import ApprovalsOrchestrator
+    from remy.agents.base import Agent
+    from remy.agents.context_assembler import ContextAssembler
+    from remy.agents.diff_validator import DiffValidator
+    from remy.agents.menu_planner import MenuPlanner
+    from remy.agents.notifier import Notifier
+    from remy.agents.nutrition_estimator import NutritionEstimator
+    from remy.agents.receipt_ingestor import ReceiptIngestor
+    from remy.agents.shopping_dispatcher import ShoppingDispatcher
+
+_LAZY = {
+    "ApprovalsOrchestrator": "remy.agents.approvals_orchestrator",
+    "Agent": "remy.agents.base",
+    "ContextAssembler": "remy.agents.context_assembler",
+    "DiffValidator": "remy.agents.diff_validator",
+    "MenuPlanner": "remy.agents.menu_planner",
+    "Notifier": "remy.agents.notifier",
+    "NutritionEstimator": "remy.agents.nutrition_estimator",
+    "ReceiptIngestor": "remy.agents.receipt_ingestor",
+    "ShoppingDispatcher": "remy.agents.shopping_dispatcher",
+}
 
 __all__ = [
     "ApprovalsOrchestrator",
@@ -21,3 +43,16 @@ __all__ = [
     "ReceiptIngestor",
     "ShoppingDispatcher",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
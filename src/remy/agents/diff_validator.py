@@ -4,8 +4,11 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
 
 from remy.agents.base import Agent
 from remy.models.context import InventoryItem, PlanningContext
@@ -67,23 +70,67 @@ _VOLUME_UNITS = {
 }
 _COUNT_UNITS = {"count", "ea", "each", "unit", "piece", "pieces", "pc", "pcs"}
 
+# Single lookup of unit -> (bucket type, multiplier); the empty unit is treated as a count.
+_UNIT_TABLE: Dict[str, tuple[str, float]] = {
+    **{unit: ("g", factor) for unit, factor in _WEIGHT_UNITS.items()},
+    **{unit: ("ml", factor) for unit, factor in _VOLUME_UNITS.items()},
+    **{unit: ("count", 1.0) for unit in _COUNT_UNITS},
+    "": ("count", 1.0),
+}
+_BUCKET_INDEX = {"g": 0, "ml": 1, "count": 2}
+_SHORTFALL_FIELDS = {"g": "need_g", "ml": "need_ml", "count": "need_count"}
+
 _COUNT_TO_WEIGHT_G = 75.0  # heuristic grams per count when only counts provided
 _MACRO_PROTEIN_SHARE = 0.25
 _MACRO_FAT_SHARE = 0.08
+# Below this many requirements per plan, NumPy setup costs more than the scalar loop.
+_VECTORIZE_MIN_REQUIREMENTS = 64
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name_cached(name: str) -> str:
+    return " ".join(name.split()).lower()
+
+
+def _convert_unit(quantity: float, unit: str) -> tuple[str, Optional[float], bool]:
+    entry = _UNIT_TABLE.get(unit)
+    if entry is None:
+        return "count", quantity, False
+    unit_type, multiplier = entry
+    return unit_type, quantity * multiplier, True
 
 
-@dataclass
 class InventoryBuckets:
-    weight_g: float = 0.0
-    volume_ml: float = 0.0
-    count: float = 0.0
-
-    def clone(self) -> "InventoryBuckets":
-        return InventoryBuckets(
-            weight_g=self.weight_g,
-            volume_ml=self.volume_ml,
-            count=self.count,
-        )
+    """Column-wise stock levels; position ``i`` holds the i-th indexed inventory item."""
+
+    __slots__ = ("weight_g", "volume_ml", "count")
+
+    def __init__(
+        self,
+        weight_g: Optional[array] = None,
+        volume_ml: Optional[array] = None,
+        count: Optional[array] = None,
+    ) -> None:
+        self.weight_g = weight_g if weight_g is not None else array("d")
+        self.volume_ml = volume_ml if volume_ml is not None else array("d")
+        self.count = count if count is not None else array("d")
+
+    def append(self, unit_type: str, value: float) -> int:
+        position = len(self.count)
+        self.weight_g.append(value if unit_type == "g" else 0.0)
+        self.volume_ml.append(value if unit_type == "ml" else 0.0)
+        self.count.append(value if unit_type == "count" else 0.0)
+        return position
+
+    @property
+    def columns(self) -> tuple[array, array, array]:
+        """Columns ordered to match ``_BUCKET_INDEX``."""
+
+        return self.weight_g, self.volume_ml, self.count
+
+    def copy(self) -> "InventoryBuckets":
+        # Slice copies run at C level; no per-item objects are allocated.
+        return InventoryBuckets(self.weight_g[:], self.volume_ml[:], self.count[:])
 
 
 class DiffValidator(Agent[tuple[PlanningContext, Plan], Plan]):
@@ -94,109 +141,153 @@ class DiffValidator(Agent[tuple[PlanningContext, Plan], Plan]):
     ingredients that are missing or insufficient.
     """
 
+    def __init__(self) -> None:
+        # (inventory fingerprint, indexes) from the previous run; the bucket template is
+        # never mutated in place, so replans against unchanged stock reuse it as-is.
+        self._index_cache: Optional[tuple[tuple, tuple]] = None
+
     def run(self, payload: tuple[PlanningContext, Plan]) -> Plan:
         context, plan = payload
-        inventory_state, unit_warnings = self._build_inventory_state(context.inventory)
-        name_index = self._build_name_index(context.inventory)
+        positions, inventory_state, unit_warnings, name_index = self._inventory_indexes(context.inventory)
         normalized_candidates: list[PlanCandidate] = []
 
-        for candidate in plan.candidates:
-            candidate_inventory = {
-                item_id: buckets.clone() for item_id, buckets in inventory_state.items()
-            }
+        allocations: Optional[List[List[float]]] = None
+        total_requirements = sum(len(candidate.ingredients_required) for candidate in plan.candidates)
+        if positions and total_requirements >= _VECTORIZE_MIN_REQUIREMENTS:
+            allocations = self._allocate_vectorized(plan.candidates, positions, inventory_state, name_index)
+
+        for index, candidate in enumerate(plan.candidates):
             normalized_candidates.append(
                 self._normalize_candidate(
-                    candidate, candidate_inventory, name_index, unit_warnings
+                    candidate,
+                    positions,
+                    inventory_state.copy() if allocations is None else inventory_state,
+                    name_index,
+                    unit_warnings,
+                    allocated=allocations[index] if allocations is not None else None,
                 )
             )
 
         return Plan(date=plan.date, candidates=normalized_candidates)
 
-    def _build_inventory_state(
+    def _inventory_indexes(
         self, inventory: list[InventoryItem]
-    ) -> tuple[Dict[int, InventoryBuckets], Dict[int, str]]:
-        state: Dict[int, InventoryBuckets] = {}
+    ) -> tuple[Dict[int, int], InventoryBuckets, Dict[int, str], Dict[str, int]]:
+        fingerprint = tuple((item.id, item.name, item.quantity, item.unit) for item in inventory)
+        cached = self._index_cache
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        indexes = self._build_inventory_indexes(inventory)
+        self._index_cache = (fingerprint, indexes)
+        return indexes
+
+    def _build_inventory_indexes(
+        self, inventory: list[InventoryItem]
+    ) -> tuple[Dict[int, int], InventoryBuckets, Dict[int, str], Dict[str, int]]:
+        """Single pass over inventory producing stock positions, buckets, unit warnings and name index."""
+
+        positions: Dict[int, int] = {}
+        state = InventoryBuckets()
         warnings: Dict[int, str] = {}
+        name_index: Dict[str, int] = {}
         for item in inventory:
             if item.id is None:
                 continue
+            # Index every identified item by name, including ones with no usable stock.
+            name = _normalize_name_cached(item.name)
+            if name and name not in name_index:
+                name_index[name] = item.id
             quantity = float(item.quantity or 0.0)
             unit = (item.unit or "").strip().lower()
             if quantity <= 0:
                 continue
-            unit_type, value, recognized = self._convert_unit(quantity, unit)
+            unit_type, value, recognized = _convert_unit(quantity, unit)
             if value is None:
                 continue
-            buckets = InventoryBuckets()
-            if unit_type == "g":
-                buckets.weight_g = value
-            elif unit_type == "ml":
-                buckets.volume_ml = value
+            position = positions.get(item.id)
+            if position is None:
+                positions[item.id] = state.append(unit_type, value)
             else:
-                buckets.count = value
-            state[item.id] = buckets
+                # Later rows for the same id replace earlier ones.
+                state.weight_g[position] = value if unit_type == "g" else 0.0
+                state.volume_ml[position] = value if unit_type == "ml" else 0.0
+                state.count[position] = value if unit_type == "count" else 0.0
             if not recognized:
                 warnings[item.id] = (
                     f"Inventory item '{item.name}' uses unit '{item.unit}', treated as count."
                 )
-        return state, warnings
-
-    def _build_name_index(self, inventory: list[InventoryItem]) -> Dict[str, int]:
-        index: Dict[str, int] = {}
-        for item in inventory:
-            if item.id is None:
-                continue
-            name = self._normalize_name(item.name)
-            if name and name not in index:
-                index[name] = item.id
-        return index
+        return positions, state, warnings, name_index
 
     def _normalize_candidate(
         self,
         candidate: PlanCandidate,
-        inventory_state: Dict[int, InventoryBuckets],
+        positions: Dict[int, int],
+        inventory_state: InventoryBuckets,
         name_index: Dict[str, int],
         unit_warnings: Dict[int, str],
+        allocated: Optional[Sequence[float]] = None,
     ) -> PlanCandidate:
-        usage: Dict[int, Dict[str, float]] = {}
+        """Build deltas/shortfalls for one candidate.
+
+        ``allocated`` carries per-requirement use amounts precomputed by
+        ``_allocate_vectorized``; without it stock is drawn from ``inventory_state`` here.
+        """
+
+        # inventory_id -> [use_g, use_ml, use_count], indexed via _BUCKET_INDEX.
+        usage: Dict[int, List[float]] = {}
+        stock_columns = inventory_state.columns
+        log_info = logger.isEnabledFor(logging.INFO)
         shortfalls: list[ShoppingShortfall] = []
         diagnostics: list[str] = []
         diag_seen: Set[str] = set()
 
-        for requirement in candidate.ingredients_required:
+        total_weight = 0.0
+        total_volume = 0.0
+        total_count = 0.0
+
+        for req_index, requirement in enumerate(candidate.ingredients_required):
+            # Mass totals for macro estimation ride along with the matching pass.
+            total_weight += requirement.quantity_g or 0.0
+            total_volume += requirement.quantity_ml or 0.0
+            total_count += requirement.quantity_count or 0.0
             req_amount, req_type = self._extract_requirement_amount(requirement)
             if req_amount is None or req_amount <= 0 or req_type is None:
                 continue
 
             inventory_id = self._resolve_inventory_id(requirement, name_index)
-            if inventory_id is not None and inventory_id in inventory_state:
-                buckets = inventory_state[inventory_id]
-                available = self._available_for_type(buckets, req_type)
-                use_amount = min(req_amount, available)
+            position = positions.get(inventory_id) if inventory_id is not None else None
+            if position is not None:
+                type_index = _BUCKET_INDEX[req_type]
+                if allocated is not None:
+                    use_amount = allocated[req_index]
+                else:
+                    column = stock_columns[type_index]
+                    use_amount = min(req_amount, column[position])
+                    column[position] = max(0.0, column[position] - use_amount)
                 if use_amount > 0:
-                    usage_entry = usage.setdefault(
-                        inventory_id, {"use_g": 0.0, "use_ml": 0.0, "use_count": 0.0}
-                    )
-                    usage_entry[f"use_{req_type}"] += use_amount
-                    self._decrement_bucket(buckets, req_type, use_amount)
+                    usage_entry = usage.get(inventory_id)
+                    if usage_entry is None:
+                        usage_entry = usage[inventory_id] = [0.0, 0.0, 0.0]
+                    usage_entry[type_index] += use_amount
                     if inventory_id in unit_warnings:
                         self._add_diag(
                             diagnostics, diag_seen, unit_warnings[inventory_id], candidate.title
                         )
                 deficit = req_amount - use_amount
                 if deficit > 1e-6:
-                    logger.info(
-                        (
-                            "DiffValidator clamp ingredient_id=%s name=%s "
-                            "requested=%.2f%s available=%.2f%s"
-                        ),
-                        inventory_id,
-                        requirement.name,
-                        req_amount,
-                        req_type,
-                        use_amount,
-                        req_type,
-                    )
+                    if log_info:
+                        logger.info(
+                            (
+                                "DiffValidator clamp ingredient_id=%s name=%s "
+                                "requested=%.2f%s available=%.2f%s"
+                            ),
+                            inventory_id,
+                            requirement.name,
+                            req_amount,
+                            req_type,
+                            use_amount,
+                            req_type,
+                        )
                     shortfalls.append(
                         self._build_shortfall(
                             requirement,
@@ -207,12 +298,13 @@ class DiffValidator(Agent[tuple[PlanningContext, Plan], Plan]):
                         )
                     )
                 continue
-            logger.info(
-                "DiffValidator missing ingredient name=%s requested=%.2f%s",
-                requirement.name,
-                req_amount,
-                req_type,
-            )
+            if log_info:
+                logger.info(
+                    "DiffValidator missing ingredient name=%s requested=%.2f%s",
+                    requirement.name,
+                    req_amount,
+                    req_type,
+                )
             shortfalls.append(
                 self._build_shortfall(
                     requirement,
@@ -226,25 +318,71 @@ class DiffValidator(Agent[tuple[PlanningContext, Plan], Plan]):
         delta_models = [
             InventoryDelta(
                 ingredient_id=ingredient_id,
-                use_g=self._maybe_value(amounts.get("use_g")),
-                use_ml=self._maybe_value(amounts.get("use_ml")),
-                use_count=self._maybe_value(amounts.get("use_count")),
+                use_g=self._maybe_value(use_g),
+                use_ml=self._maybe_value(use_ml),
+                use_count=self._maybe_value(use_count),
             )
-            for ingredient_id, amounts in usage.items()
+            for ingredient_id, (use_g, use_ml, use_count) in usage.items()
         ]
-        macros, macro_notes = self._recompute_macros(candidate)
+        macros, macro_notes = self._recompute_macros(candidate, total_weight, total_volume, total_count)
         for note in macro_notes:
             self._add_diag(diagnostics, diag_seen, note, candidate.title)
 
-        normalized_candidate = candidate.model_copy(
-            update={
-                "inventory_deltas": delta_models,
-                "shopping_shortfall": shortfalls,
-                "macros_per_serving": macros or candidate.macros_per_serving,
-                "diagnostics": diagnostics,
-            }
+        updates = {
+            "inventory_deltas": delta_models,
+            "shopping_shortfall": shortfalls,
+            "macros_per_serving": macros or candidate.macros_per_serving,
+            "diagnostics": diagnostics,
+        }
+        # Every field is either carried over from the validated candidate or built from
+        # validated models above, so skip re-validation.
+        return PlanCandidate.model_construct(
+            _fields_set=candidate.model_fields_set | updates.keys(),
+            **{**candidate.__dict__, **updates},
         )
-        return normalized_candidate
+
+    def _allocate_vectorized(
+        self,
+        candidates: Sequence[PlanCandidate],
+        positions: Dict[int, int],
+        inventory_state: InventoryBuckets,
+        name_index: Dict[str, int],
+    ) -> List[List[float]]:
+        """Draw stock for every candidate at once; returns use amounts per requirement.
+
+        Candidates are independent, so the j-th requirement of all candidates is settled in one
+        NumPy step. Each candidate touches a single cell of its own inventory slice per step, so
+        the fancy-indexed subtraction never conflicts. Unmatched requirements request 0.
+        """
+
+        width = max(len(candidate.ingredients_required) for candidate in candidates)
+        requested = np.zeros((len(candidates), width))
+        bucket_index = np.zeros((len(candidates), width), dtype=np.intp)
+        item_index = np.zeros((len(candidates), width), dtype=np.intp)
+        for row, candidate in enumerate(candidates):
+            for column, requirement in enumerate(candidate.ingredients_required):
+                req_amount, req_type = self._extract_requirement_amount(requirement)
+                if req_amount is None or req_amount <= 0 or req_type is None:
+                    continue
+                inventory_id = self._resolve_inventory_id(requirement, name_index)
+                position = positions.get(inventory_id) if inventory_id is not None else None
+                if position is None:
+                    continue
+                requested[row, column] = req_amount
+                bucket_index[row, column] = _BUCKET_INDEX[req_type]
+                item_index[row, column] = position
+
+        template = np.array(inventory_state.columns, dtype=float)
+        available = np.broadcast_to(template, (len(candidates), *template.shape)).copy()
+        rows = np.arange(len(candidates))
+        used = np.empty_like(requested)
+        for column in range(width):
+            buckets = bucket_index[:, column]
+            items = item_index[:, column]
+            step = np.minimum(requested[:, column], available[rows, buckets, items])
+            available[rows, buckets, items] -= step
+            used[:, column] = step
+        return used.tolist()
 
     def _extract_requirement_amount(
         self, requirement: IngredientRequirement
@@ -264,7 +402,7 @@ class DiffValidator(Agent[tuple[PlanningContext, Plan], Plan]):
     ) -> Optional[int]:
         if requirement.ingredient_id is not None:
             return requirement.ingredient_id
-        normalized = self._normalize_name(requirement.name)
+        normalized = _normalize_name_cached(requirement.name)
         if normalized in name_index:
             return name_index[normalized]
         return None
@@ -286,8 +424,7 @@ class DiffValidator(Agent[tuple[PlanningContext, Plan], Plan]):
             "need_count": None,
             "reason": reason,
         }
-        field = {"g": "need_g", "ml": "need_ml", "count": "need_count"}[req_type]
-        kwargs[field] = amount
+        kwargs[_SHORTFALL_FIELDS[req_type]] = amount
         return ShoppingShortfall(**kwargs)
 
     @staticmethod
@@ -296,47 +433,15 @@ class DiffValidator(Agent[tuple[PlanningContext, Plan], Plan]):
             return None
         return value if value > 1e-6 else None
 
-    def _convert_unit(self, quantity: float, unit: str) -> tuple[str, Optional[float], bool]:
-        if unit in _WEIGHT_UNITS:
-            return "g", quantity * _WEIGHT_UNITS[unit], True
-        if unit in _VOLUME_UNITS:
-            return "ml", quantity * _VOLUME_UNITS[unit], True
-        if unit in _COUNT_UNITS or not unit:
-            return "count", quantity, True
-        return "count", quantity, False
-
-    @staticmethod
-    def _normalize_name(name: str) -> str:
-        return " ".join(name.split()).strip().lower()
-
-    @staticmethod
-    def _available_for_type(buckets: InventoryBuckets, req_type: str) -> float:
-        if req_type == "g":
-            return buckets.weight_g
-        if req_type == "ml":
-            return buckets.volume_ml
-        return buckets.count
-
-    @staticmethod
-    def _decrement_bucket(buckets: InventoryBuckets, req_type: str, amount: float) -> None:
-        if req_type == "g":
-            buckets.weight_g = max(0.0, buckets.weight_g - amount)
-        elif req_type == "ml":
-            buckets.volume_ml = max(0.0, buckets.volume_ml - amount)
-        else:
-            buckets.count = max(0.0, buckets.count - amount)
-
-    def _recompute_macros(self, candidate: PlanCandidate) -> tuple[Optional[Macros], List[str]]:
-        total_weight = 0.0
-        total_volume = 0.0
-        total_count = 0.0
-        for requirement in candidate.ingredients_required:
-            if requirement.quantity_g:
-                total_weight += float(requirement.quantity_g)
-            if requirement.quantity_ml:
-                total_volume += float(requirement.quantity_ml)
-            if requirement.quantity_count:
-                total_count += float(requirement.quantity_count)
+    def _recompute_macros(
+        self,
+        candidate: PlanCandidate,
+        total_weight: float,
+        total_volume: float,
+        total_count: float,
+    ) -> tuple[Optional[Macros], List[str]]:
+        if not candidate.ingredients_required:
+            return candidate.macros_per_serving, []
 
         total_mass = total_weight + total_volume * 1.0 + total_count * _COUNT_TO_WEIGHT_G
         servings = max(1, int(candidate.servings or 1))
@@ -368,12 +473,15 @@ class DiffValidator(Agent[tuple[PlanningContext, Plan], Plan]):
 
     @staticmethod
     def _macro_delta(existing: Macros, updated: Macros) -> float:
-        fields = ("kcal", "protein_g", "carb_g", "fat_g")
         numerator = 0.0
         denominator = 0.0
-        for field in fields:
-            current = getattr(existing, field) or 0.0
-            new = getattr(updated, field) or 0.0
+        pairs = (
+            (existing.kcal or 0.0, updated.kcal or 0.0),
+            (existing.protein_g or 0.0, updated.protein_g or 0.0),
+            (existing.carb_g or 0.0, updated.carb_g or 0.0),
+            (existing.fat_g or 0.0, updated.fat_g or 0.0),
+        )
+        for current, new in pairs:
             if current == 0 and new == 0:
                 continue
             numerator += abs(current - new)
@@ -393,4 +501,5 @@ class DiffValidator(Agent[tuple[PlanningContext, Plan], Plan]):
             return
         diagnostics.append(message)
         seen.add(message)
-        logger.info("DiffValidator[%s] %s", candidate_title, message)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("DiffValidator[%s] %s", candidate_title, message)
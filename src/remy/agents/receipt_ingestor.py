@@ -2,24 +2,53 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
 from remy.agents.base import Agent
 from remy.config import get_settings
 from remy.models.receipt import ReceiptOcrResult
-from remy.ocr import ReceiptOcrService
+from remy.ocr import ReceiptLLMClient, ReceiptOcrService, ReceiptParser, build_receipt_llm_client
+
+# Each job runs tesseract, which is itself multi-threaded; a few concurrent jobs overlap the
+# I/O and process start-up without oversubscribing the CPUs.
+_DEFAULT_MAX_WORKERS = 2
+
+
+@lru_cache(maxsize=1)
+def _default_llm_client() -> Optional[ReceiptLLMClient]:
+    return build_receipt_llm_client()
+
+
+def _default_service() -> ReceiptOcrService:
+    # Only the LLM client (and its pooled connection) is shared. Each ingestor gets its own
+    # parser, whose inventory and parse caches would otherwise never see new inventory.
+    return ReceiptOcrService(
+        lang=get_settings().ocr_default_lang,
+        parser=ReceiptParser(llm_client=_default_llm_client()),
+    )
 
 
 class ReceiptIngestor(Agent[Iterable[int], List[ReceiptOcrResult]]):
     """Process receipts via OCR and return extraction results."""
 
-    def __init__(self, ocr_service: ReceiptOcrService | None = None) -> None:
-        self._ocr_service = ocr_service or ReceiptOcrService(
-            lang=get_settings().ocr_default_lang
-        )
+    def __init__(
+        self,
+        ocr_service: ReceiptOcrService | None = None,
+        *,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self._ocr_service = ocr_service if ocr_service is not None else _default_service()
+        self._max_workers = max_workers or _DEFAULT_MAX_WORKERS
 
     def run(self, payload: Iterable[int]) -> List[ReceiptOcrResult]:
-        results: List[ReceiptOcrResult] = []
-        for receipt_id in payload:
-            results.append(self._ocr_service.process_receipt(receipt_id))
-        return results
+        receipt_ids = list(payload)
+        workers = min(self._max_workers, len(receipt_ids))
+        if workers <= 1:
+            return [self._ocr_service.process_receipt(receipt_id) for receipt_id in receipt_ids]
+        # Tesseract runs as a subprocess, so threads overlap the OCR work; map keeps input order.
+        # Auto-ingestion is serialized inside ingest_receipt_items, so shared new items are
+        # created once.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="receipt-ingestor") as executor:
+            return list(executor.map(self._ocr_service.process_receipt, receipt_ids))
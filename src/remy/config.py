@@ -3,167 +3,289 @@
 from __future__ import annotations
 
 import os
+import re
+import types
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Callable, Optional, Union, get_args, get_origin, get_type_hints
 
 ENV_FILE_CANDIDATES = (Path(".env"), Path(".env.local"))
 
 
-class Settings(BaseModel):
-    """Global application settings loaded from environment variables or .env files."""
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Global application settings loaded from environment variables or .env files.
+
+    Each field's ``env`` metadata names its environment variable, or a tuple of fallback
+    names tried in order.
+    """
 
-    database_path: Path = Field(
+    database_path: Path = field(
         default=Path("./data/remy.db"),
-        description="SQLite database location.",
+        metadata={"env": "REMY_DATABASE_PATH", "description": "SQLite database location."},
     )
-    home_assistant_base_url: Optional[str] = Field(
+    home_assistant_base_url: Optional[str] = field(
         default=None,
-        description="Home Assistant base URL.",
+        metadata={"env": "REMY_HOME_ASSISTANT_BASE_URL", "description": "Home Assistant base URL."},
     )
-    home_assistant_token: Optional[str] = Field(
+    home_assistant_token: Optional[str] = field(
         default=None,
-        description="Long-lived access token.",
+        metadata={"env": "REMY_HOME_ASSISTANT_TOKEN", "description": "Long-lived access token."},
     )
-    api_token: Optional[str] = Field(
+    api_token: Optional[str] = field(
         default=None,
-        description="Bearer token required for authenticated endpoints.",
+        metadata={"env": "REMY_API_TOKEN", "description": "Bearer token required for authenticated endpoints."},
     )
-    log_level: str = Field(default="INFO", description="Logging level (DEBUG/INFO/WARNING/ERROR)")
-    log_format: str = Field(
+    log_level: str = field(
+        default="INFO",
+        metadata={"env": "REMY_LOG_LEVEL", "description": "Logging level (DEBUG/INFO/WARNING/ERROR)"},
+    )
+    log_format: str = field(
         default="plain",
-        description="Logging format (plain/json).",
+        metadata={"env": "REMY_LOG_FORMAT", "description": "Logging format (plain/json)."},
     )
-    log_requests: bool = Field(
+    log_requests: bool = field(
         default=True,
-        description="Emit request access logs when true.",
+        metadata={"env": "REMY_LOG_REQUESTS", "description": "Emit request access logs when true."},
     )
-    ocr_worker_enabled: bool = Field(
+    ocr_worker_enabled: bool = field(
         default=False,
-        description="Run the background OCR worker when true.",
+        metadata={"env": "REMY_OCR_WORKER_ENABLED", "description": "Run the background OCR worker when true."},
     )
-    ocr_worker_poll_interval: float = Field(
+    ocr_worker_poll_interval: float = field(
         default=5.0,
-        description="Seconds between OCR worker polling iterations.",
+        metadata={
+            "env": "REMY_OCR_WORKER_POLL_INTERVAL",
+            "description": "Seconds between OCR worker polling iterations.",
+        },
     )
-    ocr_worker_batch_size: int = Field(
+    ocr_worker_batch_size: int = field(
         default=5,
-        description="Maximum number of receipts to claim per OCR worker iteration.",
+        metadata={
+            "env": "REMY_OCR_WORKER_BATCH_SIZE",
+            "description": "Maximum number of receipts to claim per OCR worker iteration.",
+        },
     )
-    ocr_default_lang: str = Field(
+    ocr_default_lang: str = field(
         default="eng",
-        description="Default Tesseract language code for OCR processing.",
+        metadata={"env": "REMY_OCR_LANG", "description": "Default Tesseract language code for OCR processing."},
     )
-    ocr_archive_path: Path = Field(
+    ocr_archive_path: Path = field(
         default=Path("./data/receipts_archive"),
-        description="Directory used to store archived receipt blobs after OCR.",
+        metadata={
+            "env": "REMY_OCR_ARCHIVE_PATH",
+            "description": "Directory used to store archived receipt blobs after OCR.",
+        },
     )
-    planner_llm_base_url: Optional[str] = Field(
+    planner_llm_base_url: Optional[str] = field(
         default=None,
-        description=(
-            "Planner LLM base URL (OpenAI-compatible runtime such as llama.cpp, "
-            "vLLM, etc.)."
-        ),
+        metadata={
+            "env": ("REMY_LLM_BASE_URL", "REMY_VLLM_BASE_URL"),
+            "description": (
+                "Planner LLM base URL (OpenAI-compatible runtime such as llama.cpp, "
+                "vLLM, etc.)."
+            )
+        },
     )
-    planner_llm_model: str = Field(
+    planner_llm_model: str = field(
         default="Qwen/Qwen1.5-0.5B-Chat",
-        description="Model identifier passed to the planner LLM endpoint.",
+        metadata={
+            "env": ("REMY_LLM_MODEL", "REMY_VLLM_MODEL"),
+            "description": "Model identifier passed to the planner LLM endpoint.",
+        },
     )
-    planner_llm_temperature: float = Field(
+    planner_llm_temperature: float = field(
         default=0.2,
-        description="Sampling temperature for LLM-based planning.",
+        metadata={
+            "env": ("REMY_LLM_TEMPERATURE", "REMY_VLLM_TEMPERATURE"),
+            "description": "Sampling temperature for LLM-based planning.",
+        },
     )
-    planner_llm_max_tokens: int = Field(
+    planner_llm_max_tokens: int = field(
         default=1024,
-        description="Maximum tokens to request from the planner LLM.",
+        metadata={
+            "env": ("REMY_LLM_MAX_TOKENS", "REMY_VLLM_MAX_TOKENS"),
+            "description": "Maximum tokens to request from the planner LLM.",
+        },
     )
-    planner_llm_provider: str = Field(
+    planner_llm_provider: str = field(
         default="openai",
-        description="Planner LLM provider (openai or ollama).",
+        metadata={"env": "REMY_LLM_PROVIDER", "description": "Planner LLM provider (openai or ollama)."},
     )
-    planner_enable_recipe_search: bool = Field(
+    planner_enable_recipe_search: bool = field(
         default=False,
-        description="When true, augment planner prompt with live recipe search snippets.",
+        metadata={
+            "env": "REMY_RECIPE_SEARCH_ENABLED",
+            "description": "When true, augment planner prompt with live recipe search snippets.",
+        },
     )
-    planner_recipe_search_results: int = Field(
+    planner_recipe_search_results: int = field(
         default=5,
-        description="Number of recipe search snippets to include in the planner prompt.",
+        metadata={
+            "env": "REMY_RECIPE_SEARCH_RESULTS",
+            "description": "Number of recipe search snippets to include in the planner prompt.",
+        },
     )
-    receipt_llm_enabled: bool = Field(
+    receipt_llm_enabled: bool = field(
         default=False,
-        description="Enable LLM-assisted receipt parsing when true.",
+        metadata={"env": "REMY_RECEIPT_LLM_ENABLED", "description": "Enable LLM-assisted receipt parsing when true."},
     )
-    receipt_llm_base_url: Optional[str] = Field(
+    receipt_llm_base_url: Optional[str] = field(
         default=None,
-        description="Receipt parsing LLM base URL (falls back to planner URL when unset).",
+        metadata={
+            "env": "REMY_RECEIPT_LLM_BASE_URL",
+            "description": "Receipt parsing LLM base URL (falls back to planner URL when unset).",
+        },
     )
-    receipt_llm_model: str = Field(
+    receipt_llm_model: str = field(
         default="Qwen/Qwen1.5-0.5B-Chat",
-        description="Model identifier for receipt parsing LLM calls.",
+        metadata={"env": "REMY_RECEIPT_LLM_MODEL", "description": "Model identifier for receipt parsing LLM calls."},
     )
-    receipt_llm_temperature: float = Field(
+    receipt_llm_temperature: float = field(
         default=0.0,
-        description="Sampling temperature for receipt parsing LLM.",
+        metadata={
+            "env": "REMY_RECEIPT_LLM_TEMPERATURE",
+            "description": "Sampling temperature for receipt parsing LLM.",
+        },
     )
-    receipt_llm_max_tokens: int = Field(
+    receipt_llm_max_tokens: int = field(
         default=400,
-        description="Max tokens for receipt parsing LLM responses.",
+        metadata={"env": "REMY_RECEIPT_LLM_MAX_TOKENS", "description": "Max tokens for receipt parsing LLM responses."},
     )
-    receipt_llm_provider: str = Field(
+    receipt_llm_provider: str = field(
         default="openai",
-        description="Receipt parsing LLM provider (openai or ollama).",
+        metadata={
+            "env": "REMY_RECEIPT_LLM_PROVIDER",
+            "description": "Receipt parsing LLM provider (openai or ollama).",
+        },
     )
-    rag_enabled: bool = Field(
+    rag_enabled: bool = field(
         default=False,
-        description="Enable im2recipe RAG enrichment when true.",
+        metadata={"env": "REMY_RAG_ENABLED", "description": "Enable im2recipe RAG enrichment when true."},
     )
-    rag_model_path: Path = Field(
+    rag_model_path: Path = field(
         default=Path("./data/models/im2recipe_model.t7"),
-        description="Location where the im2recipe Torch7 model will be stored.",
+        metadata={
+            "env": "REMY_RAG_MODEL_PATH",
+            "description": "Location where the im2recipe Torch7 model will be stored.",
+        },
     )
-    rag_corpus_path: Path = Field(
+    rag_corpus_path: Path = field(
         default=Path("./data/rag/recipes_seed.json"),
-        description="JSON corpus used for retrieval-augmented prompt snippets.",
+        metadata={
+            "env": "REMY_RAG_CORPUS_PATH",
+            "description": "JSON corpus used for retrieval-augmented prompt snippets.",
+        },
     )
-    rag_top_k: int = Field(
+    rag_top_k: int = field(
         default=3,
-        description="Number of RAG hits to surface in planner prompts.",
+        metadata={"env": "REMY_RAG_TOP_K", "description": "Number of RAG hits to surface in planner prompts."},
     )
-    rag_embedding_dim: int = Field(
+    rag_embedding_dim: int = field(
         default=384,
-        description="Feature hashing dimension for the RAG vectorizer.",
+        metadata={"env": "REMY_RAG_EMBEDDING_DIM", "description": "Feature hashing dimension for the RAG vectorizer."},
     )
-    rag_index_path: Path = Field(
+    rag_index_path: Path = field(
         default=Path("./data/rag/index.ann"),
-        description="Annoy index location for the recipe corpus.",
+        metadata={"env": "REMY_RAG_INDEX_PATH", "description": "Annoy index location for the recipe corpus."},
     )
-    rag_index_trees: int = Field(
+    rag_index_trees: int = field(
         default=50,
-        description="Number of Annoy trees to use when building the recipe index.",
+        metadata={
+            "env": "REMY_RAG_INDEX_TREES",
+            "description": "Number of Annoy trees to use when building the recipe index.",
+        },
     )
 
-    model_config = ConfigDict(frozen=True)
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on", "y", "t"})
 
 
 def _coerce_bool(value: str) -> bool:
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    # Common spellings are already canonical; only normalize when the raw value misses.
+    return value in _TRUE_VALUES or value.strip().lower() in _TRUE_VALUES
+
+
+_SKIP = object()
+
+
+def _lenient(cast: Callable[[str], object]) -> Callable[[str], object]:
+    """Wrap ``cast`` so unparsable values are skipped (falling back to defaults)."""
+
+    def convert(raw: str) -> object:
+        try:
+            return cast(raw)
+        except ValueError:
+            return _SKIP
+
+    return convert
+
+
+_safe_float = _lenient(float)
+_safe_int = _lenient(int)
+
+# Converters keyed by the resolved field type (Optional[X] uses X's); numbers parse leniently.
+_CONVERTERS: dict[type, Callable[[str], object]] = {
+    Path: Path,
+    str: str,
+    bool: _coerce_bool,
+    int: _safe_int,
+    float: _safe_float,
+}
+
+
+def _converter_for(name: str, annotation: object) -> Callable[[str], object]:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    try:
+        return _CONVERTERS[annotation]  # type: ignore[index]
+    except (KeyError, TypeError):
+        raise TypeError(f"Settings.{name} has unsupported type {annotation!r} for environment loading") from None
+
+
+_SETTINGS_TYPES = get_type_hints(Settings)
+
+# (env keys in priority order, Settings field, converter), derived once from the field metadata.
+_ENV_LOOKUPS: tuple[tuple[tuple[str, ...], str, Callable[[str], object]], ...] = tuple(
+    (
+        (keys,) if isinstance(keys, str) else keys,
+        settings_field.name,
+        _converter_for(settings_field.name, _SETTINGS_TYPES[settings_field.name]),
+    )
+    for settings_field in fields(Settings)
+    for keys in (settings_field.metadata["env"],)
+)
+
+
+def _first_env(values: dict[str, str], keys: tuple[str, ...]) -> Optional[str]:
+    """Return the first non-empty value among ``keys``, stopping at the first hit."""
+
+    for key in keys:
+        value = values.get(key)
+        if value:
+            return value
+    return None
+
+
+_ENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)\s*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=4)
+def _parse_env_text(path: str, mtime_ns: int) -> dict[str, str]:
+    """Parse ``KEY=value`` lines in one regex sweep; cached until the file changes."""
+
+    text = Path(path).read_text(encoding="utf-8")
+    return dict(_ENV_LINE_RE.findall(text))
 
 
 def _parse_env_file(path: Path) -> dict[str, str]:
-    payload: dict[str, str] = {}
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            for raw_line in handle:
-                line = raw_line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key, raw_value = line.split("=", 1)
-                payload[key.strip()] = raw_value.strip()
+        return _parse_env_text(str(path), path.stat().st_mtime_ns)
     except FileNotFoundError:
         return {}
-    return payload
 
 
 def _load_env_file_values() -> dict[str, str]:
@@ -176,111 +298,22 @@ def _load_env_file_values() -> dict[str, str]:
 def _load_from_env() -> dict[str, object]:
     """Load optional overrides from env vars (with .env fallbacks)."""
 
-    file_values = _load_env_file_values()
-
-    def _env(key: str) -> Optional[str]:
-        return os.environ.get(key) or file_values.get(key)
+    # One merged snapshot: non-empty process env wins, otherwise .env values apply.
+    merged = _load_env_file_values()
+    merged.update((key, value) for key, value in os.environ.items() if value)
 
     payload: dict[str, object] = {}
-    if (db_path := _env("REMY_DATABASE_PATH")):
-        payload["database_path"] = Path(db_path)
-    if (ha_url := _env("REMY_HOME_ASSISTANT_BASE_URL")):
-        payload["home_assistant_base_url"] = ha_url
-    if (ha_token := _env("REMY_HOME_ASSISTANT_TOKEN")):
-        payload["home_assistant_token"] = ha_token
-    if (api_token := _env("REMY_API_TOKEN")):
-        payload["api_token"] = api_token
-    if (log_level := _env("REMY_LOG_LEVEL")):
-        payload["log_level"] = log_level
-    if (log_format := _env("REMY_LOG_FORMAT")):
-        payload["log_format"] = log_format
-    if (log_requests := _env("REMY_LOG_REQUESTS")):
-        payload["log_requests"] = _coerce_bool(log_requests)
-    if (ocr_worker_enabled := _env("REMY_OCR_WORKER_ENABLED")):
-        payload["ocr_worker_enabled"] = _coerce_bool(ocr_worker_enabled)
-    if (ocr_worker_poll_interval := _env("REMY_OCR_WORKER_POLL_INTERVAL")):
-        try:
-            payload["ocr_worker_poll_interval"] = float(ocr_worker_poll_interval)
-        except ValueError:
-            pass
-    if (ocr_worker_batch_size := _env("REMY_OCR_WORKER_BATCH_SIZE")):
-        try:
-            payload["ocr_worker_batch_size"] = int(ocr_worker_batch_size)
-        except ValueError:
-            pass
-    if (ocr_lang := _env("REMY_OCR_LANG")):
-        payload["ocr_default_lang"] = ocr_lang
-    if (archive_path := _env("REMY_OCR_ARCHIVE_PATH")):
-        payload["ocr_archive_path"] = Path(archive_path)
-    llm_base_url = _env("REMY_LLM_BASE_URL") or _env("REMY_VLLM_BASE_URL")
-    if llm_base_url:
-        payload["planner_llm_base_url"] = llm_base_url
-    if (planner_llm_model := _env("REMY_LLM_MODEL") or _env("REMY_VLLM_MODEL")):
-        payload["planner_llm_model"] = planner_llm_model
-    if (planner_llm_temperature := _env("REMY_LLM_TEMPERATURE") or _env("REMY_VLLM_TEMPERATURE")):
-        try:
-            payload["planner_llm_temperature"] = float(planner_llm_temperature)
-        except ValueError:
-            pass
-    if (planner_llm_max_tokens := _env("REMY_LLM_MAX_TOKENS") or _env("REMY_VLLM_MAX_TOKENS")):
-        try:
-            payload["planner_llm_max_tokens"] = int(planner_llm_max_tokens)
-        except ValueError:
-            pass
-    if (planner_llm_provider := _env("REMY_LLM_PROVIDER")):
-        payload["planner_llm_provider"] = planner_llm_provider
-    if (recipe_search_enabled := _env("REMY_RECIPE_SEARCH_ENABLED")):
-        payload["planner_enable_recipe_search"] = _coerce_bool(recipe_search_enabled)
-    if (recipe_search_results := _env("REMY_RECIPE_SEARCH_RESULTS")):
-        try:
-            payload["planner_recipe_search_results"] = int(recipe_search_results)
-        except ValueError:
-            pass
-    if (receipt_llm_enabled := _env("REMY_RECEIPT_LLM_ENABLED")):
-        payload["receipt_llm_enabled"] = _coerce_bool(receipt_llm_enabled)
-    if (receipt_llm_base := _env("REMY_RECEIPT_LLM_BASE_URL")):
-        payload["receipt_llm_base_url"] = receipt_llm_base
-    if (receipt_llm_model := _env("REMY_RECEIPT_LLM_MODEL")):
-        payload["receipt_llm_model"] = receipt_llm_model
-    if (receipt_llm_temperature := _env("REMY_RECEIPT_LLM_TEMPERATURE")):
-        try:
-            payload["receipt_llm_temperature"] = float(receipt_llm_temperature)
-        except ValueError:
-            pass
-    if (receipt_llm_max_tokens := _env("REMY_RECEIPT_LLM_MAX_TOKENS")):
-        try:
-            payload["receipt_llm_max_tokens"] = int(receipt_llm_max_tokens)
-        except ValueError:
-            pass
-    if (receipt_llm_provider := _env("REMY_RECEIPT_LLM_PROVIDER")):
-        payload["receipt_llm_provider"] = receipt_llm_provider
-    if (rag_enabled := _env("REMY_RAG_ENABLED")):
-        payload["rag_enabled"] = _coerce_bool(rag_enabled)
-    if (rag_model_path := _env("REMY_RAG_MODEL_PATH")):
-        payload["rag_model_path"] = Path(rag_model_path)
-    if (rag_corpus_path := _env("REMY_RAG_CORPUS_PATH")):
-        payload["rag_corpus_path"] = Path(rag_corpus_path)
-    if (rag_top_k := _env("REMY_RAG_TOP_K")):
-        try:
-            payload["rag_top_k"] = int(rag_top_k)
-        except ValueError:
-            pass
-    if (rag_dim := _env("REMY_RAG_EMBEDDING_DIM")):
-        try:
-            payload["rag_embedding_dim"] = int(rag_dim)
-        except ValueError:
-            pass
-    if (rag_index_path := _env("REMY_RAG_INDEX_PATH")):
-        payload["rag_index_path"] = Path(rag_index_path)
-    if (rag_index_trees := _env("REMY_RAG_INDEX_TREES")):
-        try:
-            payload["rag_index_trees"] = int(rag_index_trees)
-        except ValueError:
-            pass
+    for keys, field_name, convert in _ENV_LOOKUPS:
+        raw = _first_env(merged, keys)
+        if raw is None:
+            continue
+        value = convert(raw)
+        if value is not _SKIP:
+            payload[field_name] = value
     return payload
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """Return cached application settings."""
 
@@ -4,93 +4,265 @@
 from __future__ import annotations
 
 import json
+import weakref
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Mapping, Optional, Sequence
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+try:  # pragma: no cover - optional faster JSON parser
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from remy.config import get_settings
-from remy.models.context import InventoryItem
 
-from .models import InventoryItemORM
-from .repository import get_session, session_scope
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlalchemy import Row
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session
+
+    from remy.models.context import InventoryItem
+
+    from .models import InventoryItemORM
+
+# SQLAlchemy, the ORM models, and pydantic are imported inside the functions that use
+# them so importing this module (e.g. from CLI commands that never touch the DB) stays cheap.
 
 _UNSET = object()
+_STREAM_BATCH_SIZE = 200
+# Engines whose inventory table has been seen non-empty; a new engine (e.g. after
+# reset_repository_state) checks once more.
+_SEEDED_ENGINES: weakref.WeakSet[Engine] = weakref.WeakSet()
+_INVENTORY_FIELDS = ("id", "name", "quantity", "unit", "best_before")
+
+
+@lru_cache(maxsize=1)
+def _inventory_columns() -> tuple:
+    """Only the columns InventoryItem exposes; ordered like ``_INVENTORY_FIELDS``."""
+
+    from .models import InventoryItemORM
 
-DEFAULT_INVENTORY = [
-    {"id": 1, "name": "chicken thigh, boneless", "qty": 600, "unit": "g"},
-    {"id": 2, "name": "broccoli", "qty": 400, "unit": "g"},
-    {"id": 3, "name": "brown rice", "qty": 750, "unit": "g"},
-]
+    return (
+        InventoryItemORM.id,
+        InventoryItemORM.name,
+        InventoryItemORM.quantity,
+        InventoryItemORM.unit,
+        InventoryItemORM.best_before,
+    )
+
+# (id, name, qty, unit) rows seeded when no snapshot file exists; immutable so no caller can
+# corrupt later seeds.
+DEFAULT_INVENTORY: tuple[tuple[int, str, int, str], ...] = (
+    (1, "chicken thigh, boneless", 600, "g"),
+    (2, "broccoli", 400, "g"),
+    (3, "brown rice", 750, "g"),
+)
+
+
+@lru_cache(maxsize=8)
+def _snapshot_path_for(database_path: Path) -> Path:
+    return database_path.parent / "inventory_snapshot.json"
 
 
 def _default_snapshot_path() -> Path:
-    settings = get_settings()
-    db_path = settings.database_path
-    return db_path.parent / "inventory_snapshot.json"
+    # Keyed on the configured database path so tests that repoint settings never see a stale path.
+    return _snapshot_path_for(get_settings().database_path)
+
+
+@lru_cache(maxsize=4)
+def _parse_snapshot(path: str, mtime_ns: int) -> tuple[dict[str, object], ...]:
+    """Parse a snapshot file; cached until the file changes. Callers must not mutate the rows."""
 
+    # Both parsers accept raw bytes, skipping a separate decode-to-str pass.
+    raw = Path(path).read_bytes()
+    return tuple(orjson.loads(raw) if orjson is not None else json.loads(raw))
+
+
+def _load_snapshot_data(snapshot_path: Path | None = None) -> Optional[tuple[dict[str, object], ...]]:
+    """Return the parsed snapshot records, or ``None`` when there is no snapshot file."""
 
-def _load_snapshot_data(snapshot_path: Path | None = None) -> Iterable[dict[str, object]]:
     path = snapshot_path or _default_snapshot_path()
-    if path.exists():
-        return json.loads(path.read_text(encoding="utf-8"))
-    return DEFAULT_INVENTORY
+    try:
+        return _parse_snapshot(str(path), path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return None
+
+
+def _seed_rows(snapshot_path: Path | None = None) -> list[tuple[object, ...]]:
+    """Build ``(id, name, normalized_name, quantity, unit, best_before)`` rows, keyed rows first."""
+
+    from .models import normalize_item_name
+
+    records = _load_snapshot_data(snapshot_path)
+    if records is None:
+        return [
+            (item_id, name, normalize_item_name(name), float(qty), unit, None)
+            for item_id, name, qty, unit in DEFAULT_INVENTORY
+        ]
+
+    keyed: list[tuple[object, ...]] = []
+    unkeyed: list[tuple[object, ...]] = []
+    for record in records:
+        get = record.get
+        best_before = get("best_before")
+        if type(best_before) is str:
+            # Stored as ISO text, which is what SQLAlchemy's SQLite Date type reads back.
+            try:
+                best_before = date.fromisoformat(best_before).isoformat()
+            except ValueError:
+                best_before = None
+        elif isinstance(best_before, date):
+            best_before = best_before.isoformat()
+
+        name = str(record["name"])
+        row = (
+            name,
+            normalize_item_name(name),
+            float(get("qty") or get("quantity", 0.0)),
+            str(get("unit") or ""),
+            best_before,
+        )
+        record_id = get("id")
+        if record_id is None:
+            unkeyed.append((None, *row))
+        else:
+            keyed.append((int(record_id), *row))
+    return [*keyed, *unkeyed]
+
+
+def _reset_seed_cache() -> None:
+    """Forget which engines were seeded (for tests that empty the table on a live engine)."""
+
+    _SEEDED_ENGINES.clear()
 
 
 def _seed_inventory(session: Session, snapshot_path: Path | None = None) -> None:
+    bind = session.get_bind()
+    if bind in _SEEDED_ENGINES:
+        return
+
+    from sqlalchemy import select
+
+    from .models import InventoryItemORM
+
     exists = session.execute(select(InventoryItemORM.id).limit(1)).first()
     if exists:
+        # Only mark committed data as seeded; a seed inserted below could still roll back.
+        _SEEDED_ENGINES.add(bind)
         return
 
-    for record in _load_snapshot_data(snapshot_path):
-        best_before = record.get("best_before")
-        if isinstance(best_before, str):
-            try:
-                best_before_date = date.fromisoformat(best_before)
-            except ValueError:
-                best_before_date = None
-        else:
-            best_before_date = best_before
-
-        session.merge(
-            InventoryItemORM(
-                id=int(record.get("id")) if record.get("id") is not None else None,
-                name=str(record["name"]),
-                quantity=float(record.get("qty") or record.get("quantity", 0.0)),
-                unit=str(record.get("unit") or ""),
-                best_before=best_before_date,
-            )
-        )
+    rows = _seed_rows(snapshot_path)
+    if not rows:
+        return
 
-    session.flush()
+    # Pure bulk write: go straight to the DBAPI and skip ORM unit-of-work bookkeeping.
+    # Keyed rows go first so auto-assigned ids never collide with snapshot ids; OR REPLACE
+    # keeps the last row for a repeated id (the old merge() semantics).
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.executemany(
+            f"INSERT OR REPLACE INTO {InventoryItemORM.__tablename__} "
+            "(id, name, normalized_name, quantity, unit, best_before) VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    finally:
+        cursor.close()
+    session.expire_all()
 
 
 def _to_model(row: InventoryItemORM) -> InventoryItem:
-    payload = {
-        "id": row.id,
-        "name": row.name,
-        "qty": row.quantity,
-        "unit": row.unit,
-        "best_before": row.best_before,
-    }
-    if row.notes:
-        payload["notes"] = row.notes
-    return InventoryItem.model_validate(payload)
+    from remy.models.context import InventoryItem
+
+    from .repository import row_to_model
+
+    return row_to_model(InventoryItem, _INVENTORY_FIELDS, (row.id, row.name, row.quantity, row.unit, row.best_before))
+
+
+def iter_inventory(snapshot_path: Path | None = None) -> Iterator[InventoryItem]:
+    """Yield inventory items by name, streaming rows in batches (seeded from snapshot if empty).
+
+    Exhaust the iterator: the session commits (including any seed) once iteration finishes.
+    """
+
+    from sqlalchemy import select
+
+    from remy.models.context import InventoryItem
+
+    from .models import InventoryItemORM
+    from .repository import rows_to_models, session_scope
+
+    with session_scope() as session:
+        _seed_inventory(session, snapshot_path)
+        result = session.execute(
+            select(*_inventory_columns())
+            .order_by(InventoryItemORM.name)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        for batch in result.partitions():
+            yield from rows_to_models(InventoryItem, _INVENTORY_FIELDS, batch)
 
 
 def list_inventory(snapshot_path: Path | None = None) -> List[InventoryItem]:
     """Return inventory items stored in the database (seeded from snapshot if empty)."""
 
+    return list(iter_inventory(snapshot_path))
+
+
+def list_inventory_match_keys() -> List[Row]:
+    """Return ``(id, name, normalized_name)`` rows for every item, for name matching.
+
+    Reads the stored normalized names instead of re-normalizing each name per caller, and
+    skips building pydantic models for rows that are only scored.
+    """
+
+    from sqlalchemy import select
+
+    from .models import InventoryItemORM
+    from .repository import session_scope
+
     with session_scope() as session:
-        _seed_inventory(session, snapshot_path)
-        rows = (
-            session.execute(select(InventoryItemORM).order_by(InventoryItemORM.name))
-            .scalars()
-            .all()
+        _seed_inventory(session)
+        return session.execute(
+            select(InventoryItemORM.id, InventoryItemORM.name, InventoryItemORM.normalized_name).order_by(
+                InventoryItemORM.name
+            )
+        ).all()
+
+
+def find_inventory_items(
+    *,
+    ids: Iterable[int] = (),
+    normalized_names: Iterable[str] = (),
+) -> List[InventoryItem]:
+    """Return items whose id or normalized name is listed, via the indexed columns.
+
+    Lets callers that only need a few known items skip the full ``list_inventory`` scan.
+    """
+
+    from sqlalchemy import or_, select
+
+    from remy.models.context import InventoryItem
+
+    from .models import InventoryItemORM
+    from .repository import rows_to_models, session_scope
+
+    ids = list(ids)
+    normalized_names = list(normalized_names)
+    conditions = []
+    if ids:
+        conditions.append(InventoryItemORM.id.in_(ids))
+    if normalized_names:
+        conditions.append(InventoryItemORM.normalized_name.in_(normalized_names))
+    if not conditions:
+        return []
+
+    with session_scope() as session:
+        _seed_inventory(session)
+        result = session.execute(
+            select(*_inventory_columns()).where(or_(*conditions)).order_by(InventoryItemORM.id)
         )
-        return [_to_model(row) for row in rows]
+        return rows_to_models(InventoryItem, _INVENTORY_FIELDS, result)
 
 
 def create_inventory_item(
@@ -101,6 +273,9 @@ def create_inventory_item(
     best_before: Optional[date] = None,
     notes: Optional[str] = None,
 ) -> InventoryItem:
+    from .models import InventoryItemORM
+    from .repository import session_scope
+
     with session_scope() as session:
         db_item = InventoryItemORM(
             name=name,
@@ -114,6 +289,45 @@ def create_inventory_item(
         return _to_model(db_item)
 
 
+def apply_inventory_changes(
+    increments: Mapping[int, float],
+    new_items: Sequence[Mapping[str, object]],
+) -> List[InventoryItem]:
+    """Add quantity ``increments`` to existing items and insert ``new_items`` in one transaction.
+
+    Each new item mapping carries ``name``, ``quantity``, and ``unit``. Returns the created
+    items in the order given.
+    """
+
+    from sqlalchemy import bindparam, func, insert, update
+
+    from remy.models.context import InventoryItem
+
+    from .models import InventoryItemORM
+    from .repository import rows_to_models, session_scope
+
+    table = InventoryItemORM.__table__
+    with session_scope() as session:
+        if increments:
+            # Increment in SQL so concurrent writers are not overwritten with a stale read.
+            session.execute(
+                update(table)
+                .where(table.c.id == bindparam("item_id"))
+                .values(quantity=func.coalesce(table.c.quantity, 0.0) + bindparam("delta")),
+                [{"item_id": item_id, "delta": float(delta)} for item_id, delta in increments.items()],
+            )
+        if not new_items:
+            return []
+        rows = session.execute(
+            insert(table).returning(*_inventory_columns(), sort_by_parameter_order=True),
+            [
+                {"name": item["name"], "quantity": float(item["quantity"]), "unit": item["unit"]}
+                for item in new_items
+            ],
+        )
+        return rows_to_models(InventoryItem, _INVENTORY_FIELDS, rows)
+
+
 def update_inventory_item(
     item_id: int,
     *,
@@ -123,35 +337,65 @@ def update_inventory_item(
     best_before: Optional[date] | object = _UNSET,
     notes: Optional[str] | object = _UNSET,
 ) -> InventoryItem:
+    from sqlalchemy import select, update
+
+    from remy.models.context import InventoryItem
+
+    from .models import InventoryItemORM, normalize_item_name
+    from .repository import row_to_model, session_scope
+
+    values: dict[str, object] = {}
+    if name is not None:
+        values["name"] = name
+        values["normalized_name"] = normalize_item_name(name)
+    if quantity is not None:
+        values["quantity"] = float(quantity)
+    if unit is not None:
+        values["unit"] = unit
+    if best_before is not _UNSET:
+        values["best_before"] = best_before
+    if notes is not _UNSET:
+        values["notes"] = notes
+
+    if values:
+        # One UPDATE ... RETURNING instead of a SELECT, attribute sets, and a flushed UPDATE.
+        stmt = (
+            update(InventoryItemORM)
+            .where(InventoryItemORM.id == item_id)
+            .values(**values)
+            .returning(*_inventory_columns())
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(*_inventory_columns()).where(InventoryItemORM.id == item_id)
+
     with session_scope() as session:
-        db_item = session.get(InventoryItemORM, item_id)
-        if db_item is None:
+        row = session.execute(stmt).first()
+        if row is None:
             raise ValueError(f"Inventory item {item_id} not found")
+        return row_to_model(InventoryItem, _INVENTORY_FIELDS, row)
 
-        if name is not None:
-            db_item.name = name
-        if quantity is not None:
-            db_item.quantity = float(quantity)
-        if unit is not None:
-            db_item.unit = unit
-        if best_before is not _UNSET:
-            db_item.best_before = best_before  # type: ignore[assignment]
-        if notes is not _UNSET:
-            db_item.notes = notes  # type: ignore[assignment]
 
-        session.flush()
-        return _to_model(db_item)
+def delete_inventory_item(item_id: int) -> None:
+    from sqlalchemy import delete
 
+    from .models import InventoryItemORM
+    from .repository import session_scope
 
-def delete_inventory_item(item_id: int) -> None:
     with session_scope() as session:
-        db_item = session.get(InventoryItemORM, item_id)
-        if db_item is None:
+        result = session.execute(
+            delete(InventoryItemORM)
+            .where(InventoryItemORM.id == item_id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
             raise ValueError(f"Inventory item {item_id} not found")
-        session.delete(db_item)
 
 
 def get_inventory_item(item_id: int) -> Optional[InventoryItem]:
+    from .models import InventoryItemORM
+    from .repository import session_scope
+
     with session_scope() as session:
         row = session.get(InventoryItemORM, item_id)
         if row is None:
@@ -162,4 +406,6 @@ def get_inventory_item(item_id: int) -> Optional[InventoryItem]:
 def raw_session() -> Session:
     """Expose a session for advanced operations (primarily testing)."""
 
+    from .repository import get_session
+
     return get_session()
@@ -3,35 +3,32 @@
 from __future__ import annotations
 
 import math
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, func, insert, select
 
 from remy.models.receipt import InventorySuggestion, ReceiptLineItem
 
-from .inventory import create_inventory_item
-from .models import InventorySuggestionORM
-from .repository import session_scope
+from .models import InventoryItemORM, InventorySuggestionORM, normalize_item_name
+from .repository import rows_to_models, session_scope
 
+# Only the columns InventorySuggestion exposes; column keys double as model field names.
+_SUGGESTION_COLUMNS = (
+    InventorySuggestionORM.id,
+    InventorySuggestionORM.receipt_id,
+    InventorySuggestionORM.name,
+    InventorySuggestionORM.normalized_name,
+    InventorySuggestionORM.quantity,
+    InventorySuggestionORM.unit,
+    InventorySuggestionORM.confidence,
+    InventorySuggestionORM.notes,
+    InventorySuggestionORM.created_at,
+)
+_SUGGESTION_FIELDS = tuple(column.key for column in _SUGGESTION_COLUMNS)
 
-def _normalize_name(name: str) -> str:
-    return " ".join(name.lower().split())
 
-
-def _to_model(row: InventorySuggestionORM) -> InventorySuggestion:
-    return InventorySuggestion.model_validate(
-        {
-            "id": row.id,
-            "receipt_id": row.receipt_id,
-            "name": row.name,
-            "normalized_name": row.normalized_name,
-            "quantity": row.quantity,
-            "unit": row.unit,
-            "confidence": row.confidence,
-            "notes": row.notes,
-            "created_at": row.created_at,
-        }
-    )
+def _rows_to_models(rows: Iterable[Row]) -> List[InventorySuggestion]:
+    return rows_to_models(InventorySuggestion, _SUGGESTION_FIELDS, rows)
 
 
 def create_suggestion(
@@ -43,40 +40,67 @@ def create_suggestion(
     confidence: Optional[float] = None,
     notes: Optional[str] = None,
 ) -> InventorySuggestion:
+    # INSERT ... RETURNING hands back server defaults (id, created_at) without a refresh SELECT.
+    (suggestion,) = create_suggestions(
+        receipt_id,
+        [{"name": name, "quantity": quantity, "unit": unit, "confidence": confidence, "notes": notes}],
+    )
+    return suggestion
+
+
+def create_suggestions(receipt_id: int, items: Iterable[Dict[str, Any]]) -> List[InventorySuggestion]:
+    """Insert many suggestions for one receipt in a single executemany.
+
+    Each item may carry ``name``, ``quantity``, ``unit``, ``confidence``, and ``notes``;
+    results are returned in input order.
+    """
+
+    params = [
+        {
+            "receipt_id": receipt_id,
+            "name": item["name"],
+            "normalized_name": normalize_item_name(item["name"]),
+            "quantity": item.get("quantity"),
+            "unit": item.get("unit"),
+            "confidence": item.get("confidence"),
+            "notes": item.get("notes"),
+        }
+        for item in items
+    ]
+    if not params:
+        return []
+
+    # Core insert skips the per-row unit of work; SQLAlchemy pages the VALUES/RETURNING batches.
+    stmt = insert(InventorySuggestionORM.__table__).returning(*_SUGGESTION_COLUMNS, sort_by_parameter_order=True)
     with session_scope() as session:
-        record = InventorySuggestionORM(
-            receipt_id=receipt_id,
-            name=name,
-            normalized_name=_normalize_name(name),
-            quantity=quantity,
-            unit=unit,
-            confidence=confidence,
-            notes=notes,
-        )
-        session.add(record)
-        session.flush()
-        session.refresh(record)
-        return _to_model(record)
+        return _rows_to_models(session.execute(stmt, params))
 
 
 def list_suggestions() -> List[InventorySuggestion]:
     with session_scope() as session:
-        rows = (
-            session.execute(
-                select(InventorySuggestionORM).order_by(InventorySuggestionORM.created_at.asc())
-            )
-            .scalars()
-            .all()
+        result = session.execute(
+            select(*_SUGGESTION_COLUMNS).order_by(InventorySuggestionORM.created_at.asc())
         )
-        return [_to_model(row) for row in rows]
+        return _rows_to_models(result)
+
+
+def count_suggestions() -> int:
+    """Return the number of pending suggestions without loading any rows."""
+
+    with session_scope() as session:
+        return session.execute(select(func.count()).select_from(InventorySuggestionORM)).scalar_one()
 
 
 def delete_suggestion(suggestion_id: int) -> None:
     with session_scope() as session:
-        record = session.get(InventorySuggestionORM, suggestion_id)
-        if record is None:
+        deleted = session.execute(
+            delete(InventorySuggestionORM)
+            .where(InventorySuggestionORM.id == suggestion_id)
+            .returning(InventorySuggestionORM.id)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if deleted is None:
             raise ValueError(f"Inventory suggestion {suggestion_id} not found")
-        session.delete(record)
 
 
 def approve_suggestion(
@@ -97,21 +121,20 @@ def approve_suggestion(
             raise ValueError("Quantity must be positive for approval")
         final_unit = unit if unit is not None else record.unit or "count"
 
-        item = create_inventory_item(
-            name=final_name,
-            quantity=final_quantity,
-            unit=final_unit,
-        )
+        # Insert in this session so the new item and the suggestion removal commit together.
+        item = InventoryItemORM(name=final_name, quantity=float(final_quantity), unit=final_unit)
+        session.add(item)
         session.delete(record)
+        session.flush()
         return ReceiptLineItem(
             raw_text=record.name,
-            name=item.name,
+            name=final_name,
             quantity=final_quantity,
-            unit=item.unit,
+            unit=final_unit,
             unit_price=None,
             total_price=None,
             confidence=record.confidence or 0.0,
             inventory_match_id=item.id,
-            inventory_match_name=item.name,
+            inventory_match_name=final_name,
             inventory_match_score=None,
         )
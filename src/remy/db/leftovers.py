@@ -3,47 +3,61 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, func, select
 
 from remy.models.context import LeftoverItem
 
 from .models import LeftoverORM
-from .repository import session_scope
+from .repository import row_to_model, rows_to_models, session_scope
 
 _UNSET = object()
+# Only the columns LeftoverItem exposes; column keys double as model field names.
+_LEFTOVER_COLUMNS = (
+    LeftoverORM.id,
+    LeftoverORM.name,
+    LeftoverORM.quantity,
+    LeftoverORM.unit,
+    LeftoverORM.best_before,
+    # Blank notes read back as None, matching _to_model.
+    func.nullif(LeftoverORM.notes, "").label("notes"),
+)
+_LEFTOVER_FIELDS = tuple(column.key for column in _LEFTOVER_COLUMNS)
 
 
 def _to_model(row: LeftoverORM) -> LeftoverItem:
-    payload: dict[str, object] = {
-        "id": row.id,
-        "name": row.name,
-        "qty": row.quantity,
-        "unit": row.unit,
-        "best_before": row.best_before,
-    }
-    if row.notes:
-        payload["notes"] = row.notes
-    return LeftoverItem.model_validate(payload)
+    return row_to_model(
+        LeftoverItem,
+        _LEFTOVER_FIELDS,
+        (row.id, row.name, row.quantity, row.unit, row.best_before, row.notes or None),
+    )
+
+
+def _rows_to_models(rows: Iterable[Row]) -> List[LeftoverItem]:
+    return rows_to_models(LeftoverItem, _LEFTOVER_FIELDS, rows)
 
 
 def list_leftovers() -> List[LeftoverItem]:
     """Return all recorded leftovers sorted by urgency."""
 
     with session_scope() as session:
-        rows = (
-            session.execute(
-                select(LeftoverORM).order_by(
-                    LeftoverORM.best_before.is_(None),
-                    LeftoverORM.best_before,
-                    LeftoverORM.name,
-                )
+        # Column projection: rows never become ORM instances.
+        result = session.execute(
+            select(*_LEFTOVER_COLUMNS).order_by(
+                LeftoverORM.best_before.is_(None),
+                LeftoverORM.best_before,
+                LeftoverORM.name,
             )
-            .scalars()
-            .all()
         )
-        return [_to_model(row) for row in rows]
+        return _rows_to_models(result)
+
+
+def count_leftovers() -> int:
+    """Return the number of recorded leftovers without loading any rows."""
+
+    with session_scope() as session:
+        return session.execute(select(func.count()).select_from(LeftoverORM)).scalar_one()
 
 
 def create_leftover_item(
@@ -98,10 +112,14 @@ def update_leftover_item(
 
 def delete_leftover_item(leftover_id: int) -> None:
     with session_scope() as session:
-        db_item = session.get(LeftoverORM, leftover_id)
-        if db_item is None:
+        deleted = session.execute(
+            delete(LeftoverORM)
+            .where(LeftoverORM.id == leftover_id)
+            .returning(LeftoverORM.id)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if deleted is None:
             raise ValueError(f"Leftover item {leftover_id} not found")
-        session.delete(db_item)
 
 
 def get_leftover_item(leftover_id: int) -> Optional[LeftoverItem]:
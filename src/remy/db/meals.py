@@ -3,40 +3,44 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import List
+from typing import Iterable, List
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, func, select
 from sqlalchemy.orm import Session
 
 from remy.models.context import RecentMeal
 
 from .models import MealORM
-from .repository import get_session, session_scope
+from .repository import get_session, row_to_model, rows_to_models, session_scope
+
+# Only the columns RecentMeal exposes; column keys double as model field names.
+_MEAL_COLUMNS = (MealORM.date, MealORM.title, MealORM.rating, MealORM.notes)
+_MEAL_FIELDS = tuple(column.key for column in _MEAL_COLUMNS)
 
 
 def _to_model(row: MealORM) -> RecentMeal:
-    return RecentMeal.model_validate(
-        {
-            "date": row.date,
-            "title": row.title,
-            "rating": row.rating,
-            "notes": row.notes,
-        }
-    )
+    return row_to_model(RecentMeal, _MEAL_FIELDS, (row.date, row.title, row.rating, row.notes))
+
+
+def _rows_to_models(rows: Iterable[Row]) -> List[RecentMeal]:
+    return rows_to_models(RecentMeal, _MEAL_FIELDS, rows)
 
 
 def list_recent_meals(limit: int = 20) -> List[RecentMeal]:
     """Return the most recent meals ordered by date desc."""
 
     with session_scope() as session:
-        rows = (
-            session.execute(
-                select(MealORM).order_by(MealORM.date.desc(), MealORM.id.desc()).limit(limit)
-            )
-            .scalars()
-            .all()
+        result = session.execute(
+            select(*_MEAL_COLUMNS).order_by(MealORM.date.desc(), MealORM.id.desc()).limit(limit)
         )
-        return [_to_model(row) for row in rows]
+        return _rows_to_models(result)
+
+
+def count_meals() -> int:
+    """Return the number of recorded meals without loading any rows."""
+
+    with session_scope() as session:
+        return session.execute(select(func.count()).select_from(MealORM)).scalar_one()
 
 
 def record_meal(meal: RecentMeal) -> RecentMeal:
@@ -73,13 +77,11 @@ def delete_meal(meal_date: date, title: str) -> None:
     """Remove a meal entry, if present."""
 
     with session_scope() as session:
-        row = (
-            session.execute(
-                select(MealORM).where(MealORM.date == meal_date, MealORM.title == title)
-            ).scalar_one_or_none()
+        session.execute(
+            delete(MealORM)
+            .where(MealORM.date == meal_date, MealORM.title == title)
+            .execution_options(synchronize_session=False)
         )
-        if row:
-            session.delete(row)
 
 
 def raw_session() -> Session:
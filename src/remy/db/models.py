@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 
 from sqlalchemy import (
@@ -11,6 +12,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     LargeBinary,
     String,
@@ -18,7 +20,19 @@ from sqlalchemy import (
     UniqueConstraint,
     func,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+
+@lru_cache(maxsize=4096)
+def normalize_item_name(name: str) -> str:
+    """Return the case- and whitespace-insensitive key used to match item names."""
+
+    # Receipt imports repeat the same product names heavily; pure, so safe to memoize.
+    return " ".join(name.lower().split())
+
+
+def _normalized_name_default(context) -> str:
+    return normalize_item_name(context.get_current_parameters()["name"])
 
 
 class Base(DeclarativeBase):
@@ -32,6 +46,10 @@ class InventoryItemORM(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Filled on insert (ORM or Core); updates that rename an item must set it explicitly.
+    normalized_name: Mapped[Optional[str]] = mapped_column(
+        String(255), nullable=True, default=_normalized_name_default
+    )
     quantity: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     unit: Mapped[str] = mapped_column(String(64), nullable=False, default="g")
     best_before: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
@@ -48,6 +66,11 @@ class InventoryItemORM(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        Index("ix_inventory_items_name", "name"),
+        Index("ix_inventory_items_normalized_name", "normalized_name"),
+    )
+
 
 class LeftoverORM(Base):
     """Prepared leftovers captured after previous meals."""
@@ -72,6 +95,12 @@ class LeftoverORM(Base):
         nullable=False,
     )
 
+    # Matches list_leftovers' ORDER BY (undated last, then soonest, then name) so SQLite
+    # walks the index instead of sorting.
+    __table_args__ = (
+        Index("ix_leftovers_urgency", best_before.is_(None), best_before, name),
+    )
+
 
 class MealORM(Base):
     """Historical meal record, including ratings for preference learning."""
@@ -118,12 +147,19 @@ class ReceiptORM(Base):
     size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
     content: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     content_path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    # NULL means ``content`` holds the upload verbatim; "zstd" means it is zstd-compressed.
+    content_encoding: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime,
         server_default=func.now(),
         nullable=False,
     )
+    ocr: Mapped[Optional["ReceiptOcrResultORM"]] = relationship(
+        uselist=False,
+        lazy="joined",
+        cascade="all, delete-orphan",
+    )
 
 
 class ReceiptOcrResultORM(Base):
@@ -171,6 +207,8 @@ class InventorySuggestionORM(Base):
         nullable=False,
     )
 
+    __table_args__ = (Index("ix_inventory_suggestions_normalized_name", "normalized_name"),)
+
 
 class ShoppingListItemORM(Base):
     """User-managed shopping list entries."""
@@ -7,7 +7,13 @@ import json
 import logging
 from typing import Dict
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from remy.models.context import Preferences
 
@@ -16,19 +22,19 @@ from .repository import session_scope
 
 logger = logging.getLogger(__name__)
 
-PREFERENCE_KEYS = {"diet", "max_time_min", "allergens"}
+PREFERENCE_KEYS = frozenset({"diet", "max_time_min", "allergens"})
 
 
 def _encode_value(value) -> str:
-    if isinstance(value, (list, dict)):
-        return json.dumps(value)
+    if orjson is not None:
+        return orjson.dumps(value).decode()
     return json.dumps(value)
 
 
 def _decode_value(value: str):
     try:
-        return json.loads(value)
-    except json.JSONDecodeError:
+        return orjson.loads(value) if orjson is not None else json.loads(value)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
         return value
 
 
@@ -50,13 +56,20 @@ def load_preferences() -> Preferences:
 def save_preferences(prefs: Preferences) -> Preferences:
     """Persist the provided preferences payload."""
 
-    payload = prefs.model_dump()
+    # Dump only the persisted keys rather than building the full dict and filtering it.
+    payload = prefs.model_dump(include=PREFERENCE_KEYS)
     logger.debug("Persisting preferences payload=%s", payload)
 
-    with session_scope() as session:
-        for key, value in payload.items():
-            if key not in PREFERENCE_KEYS:
-                continue
-            session.merge(PreferenceORM(key=key, value=_encode_value(value)))
-
-    return load_preferences()
+    rows = [{"key": key, "value": _encode_value(value)} for key, value in payload.items()]
+    if rows:
+        # One multi-row upsert instead of a SELECT + INSERT/UPDATE merge() per key.
+        stmt = sqlite_insert(PreferenceORM).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PreferenceORM.key],
+            set_={"value": stmt.excluded.value, "updated_at": func.now()},
+        )
+        with session_scope() as session:
+            session.execute(stmt)
+
+    # Stored values are a JSON round-trip of this frozen model, so re-reading would return an equal copy.
+    return prefs
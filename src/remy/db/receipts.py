@@ -7,35 +7,75 @@ import gzip
 import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from sqlalchemy import select, text
+from sqlalchemy import Row, delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import load_only
+
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional SIMD hash for archive names
+    import blake3
+except ImportError:  # pragma: no cover
+    blake3 = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional compression for stored receipt content
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
 
 from remy.models.receipt import Receipt, ReceiptOcrResult
 
 from .models import ReceiptOcrResultORM, ReceiptORM
-from .repository import session_scope
+from .repository import row_to_model, rows_to_models, session_scope
+
+_BLOB_CHUNK_SIZE = 64 * 1024
+_ZSTD_LEVEL = 3
+
+# Only the columns Receipt exposes (never the blob); column keys double as model field names.
+_RECEIPT_COLUMNS = (
+    ReceiptORM.id,
+    ReceiptORM.filename,
+    ReceiptORM.content_type,
+    ReceiptORM.size_bytes,
+    ReceiptORM.notes,
+    ReceiptORM.uploaded_at,
+)
+_RECEIPT_FIELDS = tuple(column.key for column in _RECEIPT_COLUMNS)
+_OCR_FIELDS = (
+    "receipt_id",
+    "status",
+    "text",
+    "confidence",
+    "metadata",
+    "error_message",
+    "created_at",
+    "updated_at",
+)
 
 
 def _to_receipt_model(row: ReceiptORM) -> Receipt:
-    return Receipt.model_validate(
-        {
-            "id": row.id,
-            "filename": row.filename,
-            "content_type": row.content_type,
-            "size_bytes": row.size_bytes,
-            "notes": row.notes,
-            "uploaded_at": row.uploaded_at,
-        }
-    )
+    return _row_to_receipt_model((row.id, row.filename, row.content_type, row.size_bytes, row.notes, row.uploaded_at))
+
+
+def _row_to_receipt_model(row: Row) -> Receipt:
+    return row_to_model(Receipt, _RECEIPT_FIELDS, row)
+
+
+def _rows_to_receipt_models(rows: Iterable[Row]) -> List[Receipt]:
+    return rows_to_models(Receipt, _RECEIPT_FIELDS, rows)
 
 
 def _payload_to_dict(payload: Optional[str]) -> Optional[Dict[str, Any]]:
     if payload is None:
         return None
     try:
-        parsed = json.loads(payload)
-    except json.JSONDecodeError:
+        parsed = orjson.loads(payload) if orjson is not None else json.loads(payload)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
         return {"raw": payload}
     if isinstance(parsed, dict):
         return parsed
@@ -45,31 +85,76 @@ def _payload_to_dict(payload: Optional[str]) -> Optional[Dict[str, Any]]:
 def _dict_to_payload(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
     if metadata is None:
         return None
+    if orjson is not None:
+        # Same compact, key-sorted text as the stdlib branch.
+        return orjson.dumps(metadata, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
     return json.dumps(metadata, separators=(",", ":"), sort_keys=True)
 
 
 def _to_ocr_model(row: ReceiptOcrResultORM) -> ReceiptOcrResult:
-    return ReceiptOcrResult.model_validate(
-        {
-            "receipt_id": row.receipt_id,
-            "status": row.status,
-            "text": row.text,
-            "confidence": row.confidence,
-            "metadata": _payload_to_dict(row.payload),
-            "error_message": row.error_message,
-            "created_at": row.created_at,
-            "updated_at": row.updated_at,
-        }
+    return row_to_model(
+        ReceiptOcrResult,
+        _OCR_FIELDS,
+        (
+            row.receipt_id,
+            row.status,
+            row.text,
+            row.confidence,
+            _payload_to_dict(row.payload),
+            row.error_message,
+            row.created_at,
+            row.updated_at,
+        ),
     )
 
 
-def _ensure_ocr_record(session, receipt_id: int) -> ReceiptOcrResultORM:
-    record = session.get(ReceiptOcrResultORM, receipt_id)
-    if record is None:
-        record = ReceiptOcrResultORM(receipt_id=receipt_id, status="pending")
-        session.add(record)
-        session.flush()
-    return record
+def _encode_content(content: bytes) -> Tuple[bytes, Optional[str]]:
+    """Return ``(stored_bytes, content_encoding)``, compressing only when it pays off."""
+
+    if zstandard is not None:
+        # Compressor objects are not safe to share across threads; they are cheap to build.
+        compressed = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(content)
+        # Already-compressed images (JPEG/PNG) rarely shrink; keep those verbatim.
+        if len(compressed) < len(content):
+            return compressed, "zstd"
+    return content, None
+
+
+def _decode_content(stored: bytes, encoding: Optional[str]) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdDecompressor().decompress(stored)
+    return stored
+
+
+def _iter_archive(path: Path) -> Iterator[bytes]:
+    """Yield the decompressed archive in chunks without loading the whole file."""
+
+    with path.open("rb") as raw:
+        if path.suffix == ".zst":
+            reader = zstandard.ZstdDecompressor().stream_reader(raw)
+        else:
+            reader = gzip.GzipFile(fileobj=raw, mode="rb")
+        with reader:
+            while chunk := reader.read(_BLOB_CHUNK_SIZE):
+                yield chunk
+
+
+def _iter_stored_content(stored: bytes, encoding: Optional[str]) -> Iterator[bytes]:
+    if encoding == "zstd":
+        yield from zstandard.ZstdDecompressor().read_to_iter(stored, write_size=_BLOB_CHUNK_SIZE)
+    else:
+        yield stored
+
+
+def _archive_writer(encoding: Optional[str]) -> Tuple[str, Callable[[Path], IO[bytes]]]:
+    """Return the archive suffix and opener for content stored with ``encoding``."""
+
+    if encoding == "zstd":
+        # Already a zstd frame; copy it out verbatim.
+        return ".bin.zst", lambda path: path.open("wb")
+    if zstandard is not None:
+        return ".bin.zst", lambda path: zstandard.ZstdCompressor(level=_ZSTD_LEVEL).stream_writer(path.open("wb"))
+    return ".bin.gz", lambda path: gzip.open(path, "wb")
 
 
 def store_receipt(
@@ -82,18 +167,19 @@ def store_receipt(
     """Persist a raw receipt and return its metadata."""
 
     size_bytes = len(content)
+    stored, encoding = _encode_content(content)
     with session_scope() as session:
-        _ensure_receipt_columns(session)
         record = ReceiptORM(
             filename=filename,
             content_type=content_type,
             size_bytes=size_bytes,
-            content=content,
+            content=stored,
+            content_encoding=encoding,
             notes=notes,
+            ocr=ReceiptOcrResultORM(status="pending"),
         )
         session.add(record)
         session.flush()
-        _ensure_ocr_record(session, record.id)
         return _to_receipt_model(record)
 
 
@@ -101,96 +187,142 @@ def list_receipts() -> List[Receipt]:
     """Return all stored receipts sorted by newest first."""
 
     with session_scope() as session:
-        _ensure_receipt_columns(session)
-        rows = (
-            session.execute(select(ReceiptORM).order_by(ReceiptORM.uploaded_at.desc()))
-            .scalars()
-            .all()
-        )
-        return [_to_receipt_model(row) for row in rows]
+        result = session.execute(select(*_RECEIPT_COLUMNS).order_by(ReceiptORM.uploaded_at.desc()))
+        return _rows_to_receipt_models(result)
+
+
+def count_receipts() -> int:
+    """Return the number of stored receipts without loading any rows."""
+
+    with session_scope() as session:
+        return session.execute(select(func.count()).select_from(ReceiptORM)).scalar_one()
 
 
 def fetch_receipt(receipt_id: int) -> Receipt:
     """Return receipt metadata or raise if not found."""
 
     with session_scope() as session:
-        _ensure_receipt_columns(session)
         record = session.get(ReceiptORM, receipt_id)
         if record is None:
             raise ValueError(f"Receipt {receipt_id} not found")
         return _to_receipt_model(record)
 
 
+def _load_receipt_content(receipt_id: int) -> Tuple[Receipt, Optional[bytes], Optional[str], Optional[Path]]:
+    with session_scope() as session:
+        row = session.execute(
+            select(
+                *_RECEIPT_COLUMNS, ReceiptORM.content, ReceiptORM.content_encoding, ReceiptORM.content_path
+            ).where(ReceiptORM.id == receipt_id)
+        ).first()
+    if row is None:
+        raise ValueError(f"Receipt {receipt_id} not found")
+    *columns, content, encoding, content_path = row
+    metadata = _row_to_receipt_model(columns)
+    # Check codecs up front: the streaming readers are generators and would fail mid-response.
+    if content is not None:
+        if encoding is not None and (encoding != "zstd" or zstandard is None):
+            raise ValueError(f"Receipt {receipt_id} content uses unsupported encoding {encoding!r}")
+        return metadata, content, encoding, None
+    if content_path:
+        path = Path(content_path)
+        if not path.exists():
+            raise ValueError(f"Archived content missing for receipt {receipt_id}")
+        if path.suffix == ".zst" and zstandard is None:
+            raise ValueError(f"Archived content for receipt {receipt_id} needs the zstandard package")
+        return metadata, None, None, path
+    raise ValueError(f"Receipt {receipt_id} has no stored content")
+
+
 def fetch_receipt_blob(receipt_id: int) -> Tuple[Receipt, bytes]:
     """Return receipt metadata and raw bytes."""
 
-    with session_scope() as session:
-        _ensure_receipt_columns(session)
-        record = session.get(ReceiptORM, receipt_id)
-        if record is None:
-            raise ValueError(f"Receipt {receipt_id} not found")
-        metadata = _to_receipt_model(record)
-        if record.content is not None:
-            return metadata, bytes(record.content)
-        if record.content_path:
-            path = Path(record.content_path)
-            if not path.exists():
-                raise ValueError(f"Archived content missing for receipt {receipt_id}")
-            with gzip.open(path, "rb") as handle:
-                return metadata, handle.read()
-        raise ValueError(f"Receipt {receipt_id} has no stored content")
+    metadata, content, encoding, path = _load_receipt_content(receipt_id)
+    if content is not None:
+        # sqlite3 already returns an immutable bytes object; raw content is handed over as-is.
+        return metadata, _decode_content(content, encoding)
+    return metadata, b"".join(_iter_archive(path))
+
+
+def fetch_receipt_blob_stream(receipt_id: int) -> Tuple[Receipt, Iterator[bytes]]:
+    """Return receipt metadata and an iterator over the raw bytes.
+
+    Archived content is decompressed lazily as the iterator is consumed, so callers that
+    forward the bytes (e.g. HTTP downloads) never hold the whole file in memory.
+    """
+
+    metadata, content, encoding, path = _load_receipt_content(receipt_id)
+    if content is not None:
+        return metadata, _iter_stored_content(content, encoding)
+    return metadata, _iter_archive(path)
 
 
 def delete_receipt(receipt_id: int) -> None:
     """Delete a stored receipt."""
 
     with session_scope() as session:
-        record = session.get(ReceiptORM, receipt_id)
-        if record is None:
+        row = session.execute(
+            delete(ReceiptORM)
+            .where(ReceiptORM.id == receipt_id)
+            .returning(ReceiptORM.content_path)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if row is None:
             raise ValueError(f"Receipt {receipt_id} not found")
-        if record.content_path:
-            path = Path(record.content_path)
+        # SQLite foreign keys are off, so the ORM cascade is replaced by an explicit delete.
+        session.execute(
+            delete(ReceiptOcrResultORM)
+            .where(ReceiptOcrResultORM.receipt_id == receipt_id)
+            .execution_options(synchronize_session=False)
+        )
+        if row.content_path:
+            path = Path(row.content_path)
             if path.exists():
                 path.unlink()
-        ocr_record = session.get(ReceiptOcrResultORM, receipt_id)
-        if ocr_record is not None:
-            session.delete(ocr_record)
-        session.delete(record)
 
 
 def claim_receipts_for_ocr(limit: int = 5) -> List[int]:
     """Mark up to `limit` pending receipts for processing and return their IDs."""
 
+    claimable = ReceiptOcrResultORM.status.in_(("pending", "failed"))
+    oldest_first = (
+        select(ReceiptOcrResultORM.receipt_id)
+        .where(claimable)
+        .order_by(ReceiptOcrResultORM.updated_at.asc(), ReceiptOcrResultORM.receipt_id.asc())
+        .limit(limit)
+    )
     with session_scope() as session:
-        rows = (
+        candidates = list(session.execute(oldest_first).scalars())
+        if not candidates:
+            return []
+        # One UPDATE ... RETURNING marks the batch. Re-checking the status means a receipt
+        # another worker claimed in the meantime is skipped rather than claimed twice.
+        # RETURNING has no defined order (and updated_at is already bumped), so the batch is
+        # put back into the oldest-first order of the selection.
+        claimed = set(
             session.execute(
-                select(ReceiptOcrResultORM)
-                .where(ReceiptOcrResultORM.status.in_(("pending", "failed")))
-                .order_by(ReceiptOcrResultORM.updated_at.asc())
-                .limit(limit)
-            )
-            .scalars()
-            .all()
+                update(ReceiptOcrResultORM)
+                .where(ReceiptOcrResultORM.receipt_id.in_(candidates), claimable)
+                .values(status="processing")
+                .returning(ReceiptOcrResultORM.receipt_id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
         )
-        claimed: List[int] = []
-        for row in rows:
-            row.status = "processing"
-            session.flush()
-            claimed.append(row.receipt_id)
-        return claimed
+        return [receipt_id for receipt_id in candidates if receipt_id in claimed]
 
 
 def get_receipt_ocr(receipt_id: int) -> Optional[ReceiptOcrResult]:
     """Return OCR result metadata for a receipt, if present."""
 
     with session_scope() as session:
-        receipt = session.get(ReceiptORM, receipt_id)
+        # One query: the receipt's id plus its OCR row via the joined relationship.
+        receipt = session.get(ReceiptORM, receipt_id, options=[load_only(ReceiptORM.id)])
         if receipt is None:
             raise ValueError(f"Receipt {receipt_id} not found")
-        record = session.get(ReceiptOcrResultORM, receipt_id)
-        if record is None:
-            record = _ensure_ocr_record(session, receipt_id)
-        return _to_ocr_model(record)
+        if receipt.ocr is None:
+            receipt.ocr = ReceiptOcrResultORM(status="pending")
+            session.flush()
+        return _to_ocr_model(receipt.ocr)
 
 
 def update_receipt_ocr(
@@ -204,16 +336,35 @@ def update_receipt_ocr(
 ) -> ReceiptOcrResult:
     """Create or update OCR metadata for a receipt and return the latest view."""
 
+    values = {
+        "status": status,
+        "text": text,
+        "confidence": confidence,
+        "payload": _dict_to_payload(metadata),
+        "error_message": error_message,
+    }
+    # One upsert whose RETURNING carries the timestamps, instead of get + flush + refresh.
+    stmt = sqlite_insert(ReceiptOcrResultORM).values(receipt_id=receipt_id, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReceiptOcrResultORM.receipt_id],
+        set_={**values, "updated_at": func.now()},
+    ).returning(ReceiptOcrResultORM.created_at, ReceiptOcrResultORM.updated_at)
     with session_scope() as session:
-        record = _ensure_ocr_record(session, receipt_id)
-        record.status = status
-        record.text = text
-        record.confidence = confidence
-        record.payload = _dict_to_payload(metadata)
-        record.error_message = error_message
-        session.flush()
-        session.refresh(record)
-        return _to_ocr_model(record)
+        created_at, updated_at = session.execute(stmt).one()
+    return row_to_model(
+        ReceiptOcrResult,
+        _OCR_FIELDS,
+        (
+            receipt_id,
+            status,
+            text,
+            confidence,
+            _payload_to_dict(values["payload"]),
+            error_message,
+            created_at,
+            updated_at,
+        ),
+    )
 
 
 def offload_receipt_content(receipt_id: int, *, archive_dir: Path) -> Optional[Path]:
@@ -221,34 +372,43 @@ def offload_receipt_content(receipt_id: int, *, archive_dir: Path) -> Optional[P
 
     archive_dir.mkdir(parents=True, exist_ok=True)
     with session_scope() as session:
-        record = session.get(ReceiptORM, receipt_id)
-        if record is None:
+        row = session.execute(
+            select(func.length(ReceiptORM.content), ReceiptORM.content_encoding, ReceiptORM.content_path).where(
+                ReceiptORM.id == receipt_id
+            )
+        ).first()
+        if row is None:
             raise ValueError(f"Receipt {receipt_id} not found")
-        if record.content is None:
-            if record.content_path:
-                path = Path(record.content_path)
-                return path
+        content_length, encoding, content_path = row
+        if content_length is None:
+            if content_path:
+                return Path(content_path)
             return None
 
-        digest = hashlib.sha256(record.content).hexdigest()[:16]
-        target_path = archive_dir / f"receipt_{receipt_id}_{digest}.bin.gz"
-        with gzip.open(target_path, "wb") as handle:
-            handle.write(bytes(record.content))
-
-        record.content = None
-        record.content_path = str(target_path)
-        session.flush()
-        return target_path
-def _ensure_receipt_columns(session) -> None:
-    columns = session.execute(text("PRAGMA table_info(receipts)")).fetchall()
-    column_names = {row[1] for row in columns}
-    if "content" not in column_names:
-        # Legacy schema; nothing to do since content column is required for earlier versions.
-        return
-    if "content_path" not in column_names:
+        # Stream the blob with incremental I/O, hashing and writing each chunk in one pass
+        # so the full payload is never materialized in Python. Archives are zstd frames
+        # (gzip only when zstandard is not installed) so reads can decompress incrementally.
+        # The digest only de-duplicates archive filenames, so any fast hash will do.
+        digest = blake3.blake3() if blake3 is not None else hashlib.sha256()
+        suffix, opener = _archive_writer(encoding)
+        partial_path = archive_dir / f"receipt_{receipt_id}.partial{suffix}"
+        raw_connection = session.connection().connection.dbapi_connection
         try:
-            session.execute(text("ALTER TABLE receipts ADD COLUMN content_path TEXT"))
-        except Exception:
-            session.rollback()
-    # SQLite cannot alter column nullability directly; new code handles NULL
-    # content by reading from archived blobs when necessary.
+            with raw_connection.blobopen(
+                ReceiptORM.__tablename__, "content", receipt_id, readonly=True
+            ) as blob, opener(partial_path) as handle:
+                while chunk := blob.read(_BLOB_CHUNK_SIZE):
+                    digest.update(chunk)
+                    handle.write(chunk)
+            target_path = archive_dir / f"receipt_{receipt_id}_{digest.hexdigest()[:16]}{suffix}"
+            partial_path.replace(target_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+
+        session.execute(
+            update(ReceiptORM)
+            .where(ReceiptORM.id == receipt_id)
+            .values(content=None, content_encoding=None, content_path=str(target_path))
+            .execution_options(synchronize_session=False)
+        )
+        return target_path
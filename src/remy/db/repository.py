@@ -4,21 +4,49 @@ from __future__ import annotations
 
 import logging
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator, Iterable, List, Sequence, TypeVar
 
-from sqlalchemy import create_engine
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.schema import CreateIndex
 
 from remy.config import get_settings
-from remy.db.models import Base
+from remy.db.models import Base, normalize_item_name
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 _engine: Engine | None = None
 _session_factory: sessionmaker[Session] | None = None
 logger = logging.getLogger(__name__)
 
+_POOL_SIZE = 5
+_POOL_MAX_OVERFLOW = 10
+
+# Applied to every new DBAPI connection. WAL + synchronous=NORMAL drops the per-commit fsync
+# pair of the default rollback journal while staying durable across application crashes.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 def get_engine(database_path: Path | None = None) -> Engine:
     """Return a shared SQLAlchemy engine configured for SQLite."""
@@ -31,22 +59,98 @@ def get_engine(database_path: Path | None = None) -> Engine:
     db_path = database_path or settings.database_path
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Keep a small pool of open connections so session_scope() reuses an already-configured
+    # sqlite3 handle instead of reopening the file and replaying PRAGMAs. Pooled connections
+    # move between threads (FastAPI's worker pool), hence check_same_thread=False.
     _engine = create_engine(
         f"sqlite:///{db_path}",
         future=True,
         echo=False,
+        poolclass=QueuePool,
+        pool_size=_POOL_SIZE,
+        max_overflow=_POOL_MAX_OVERFLOW,
+        pool_pre_ping=False,
+        connect_args={"check_same_thread": False},
     )
+    event.listen(_engine, "connect", _configure_sqlite_connection)
     try:
         Base.metadata.create_all(_engine)
+        # Columns first: indexes may cover columns that older databases are missing.
+        _ensure_receipt_columns(_engine)
+        _ensure_inventory_columns(_engine)
+        _ensure_indexes(_engine)
     except OperationalError as exc:
         if "already exists" in str(exc).lower():
             logger.debug("Database schema already initialized: %s", exc)
         else:
             raise
     _session_factory = sessionmaker(bind=_engine, autoflush=False, autocommit=False, future=True)
+    # From here on the factory itself is the session constructor; session_scope() and later
+    # ``get_session`` lookups skip the initialization guard entirely.
+    globals()["get_session"] = _session_factory
     return _engine
 
 
+def _ensure_indexes(engine: Engine) -> None:
+    """Create indexes added after a table was first created (create_all skips existing tables)."""
+
+    # IF NOT EXISTS instead of checkfirst: reflection cannot see expression indexes.
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+# Columns added to ``receipts`` after its first release, in the order they were introduced.
+_RECEIPT_ADDED_COLUMNS = (
+    ("content_path", "TEXT"),
+    ("content_encoding", "VARCHAR(16)"),
+)
+
+
+def _ensure_receipt_columns(engine: Engine) -> None:
+    """Add columns introduced after a database's ``receipts`` table was created."""
+
+    with engine.begin() as connection:
+        column_names = {row[1] for row in connection.exec_driver_sql("PRAGMA table_info(receipts)")}
+        if "content" not in column_names:
+            # Legacy schema; nothing to do since content column is required for earlier versions.
+            return
+        for column_name, column_type in _RECEIPT_ADDED_COLUMNS:
+            if column_name in column_names:
+                continue
+            try:
+                connection.exec_driver_sql(f"ALTER TABLE receipts ADD COLUMN {column_name} {column_type}")
+            except OperationalError as exc:
+                # Another process migrated the table between our PRAGMA and ALTER.
+                if "duplicate column" not in str(exc).lower():
+                    raise
+    # SQLite cannot alter column nullability directly; new code handles NULL
+    # content by reading from archived blobs when necessary.
+
+
+def _ensure_inventory_columns(engine: Engine) -> None:
+    """Add and backfill ``inventory_items.normalized_name`` on databases created before it."""
+
+    with engine.begin() as connection:
+        column_names = {row[1] for row in connection.exec_driver_sql("PRAGMA table_info(inventory_items)")}
+        if "normalized_name" in column_names:
+            return
+        try:
+            connection.exec_driver_sql("ALTER TABLE inventory_items ADD COLUMN normalized_name VARCHAR(255)")
+        except OperationalError as exc:
+            # Another process migrated the table between our PRAGMA and ALTER.
+            if "duplicate column" not in str(exc).lower():
+                raise
+            return
+        rows = connection.exec_driver_sql("SELECT id, name FROM inventory_items").all()
+        if rows:
+            connection.exec_driver_sql(
+                "UPDATE inventory_items SET normalized_name = ? WHERE id = ?",
+                [(normalize_item_name(name), item_id) for item_id, name in rows],
+            )
+
+
 def get_session() -> Session:
     """Return a new SQLAlchemy session."""
     global _session_factory
@@ -57,6 +161,11 @@ def get_session() -> Session:
     return _session_factory()
 
 
+# get_engine() rebinds ``get_session`` to the session factory; keep the lazy initializer around
+# so reset_repository_state() can restore it.
+_lazy_get_session = get_session
+
+
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
     """Context manager yielding a session with automatic commit/rollback."""
@@ -71,7 +180,34 @@ def session_scope() -> Generator[Session, None, None]:
         session.close()
 
 
-__all__ = ["get_engine", "get_session", "session_scope", "reset_repository_state"]
+# Every db helper turns rows into models through pydantic validation; a whole result goes
+# through one TypeAdapter call, which beats building the models one at a time.
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def rows_to_models(model: type[ModelT], fields: Sequence[str], rows: Iterable[Sequence[Any]]) -> List[ModelT]:
+    """Validate ``rows`` (values ordered like ``fields``) into ``model`` instances."""
+
+    return _list_adapter(model).validate_python([dict(zip(fields, row, strict=True)) for row in rows])
+
+
+def row_to_model(model: type[ModelT], fields: Sequence[str], row: Sequence[Any]) -> ModelT:
+    """Validate a single row (values ordered like ``fields``) into a ``model`` instance."""
+
+    (item,) = rows_to_models(model, fields, (row,))
+    return item
+
+
+__all__ = [
+    "get_engine",
+    "get_session",
+    "session_scope",
+    "reset_repository_state",
+    "rows_to_models",
+    "row_to_model",
+]
 
 
 def reset_repository_state() -> None:
@@ -82,3 +218,4 @@ def reset_repository_state() -> None:
         _engine.dispose()
     _engine = None
     _session_factory = None
+    globals()["get_session"] = _lazy_get_session
@@ -3,30 +3,66 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
 
-from sqlalchemy import delete, select
+from sqlalchemy import Row, Select, Update, bindparam, delete, select, update
 
 from remy.models.shopping import ShoppingListItem
 
 from .models import ShoppingListItemORM
-from .repository import session_scope
+from .repository import row_to_model, rows_to_models, session_scope
 
 _UNSET = object()
+# Only the columns ShoppingListItem exposes; column keys double as model field names.
+_SHOPPING_COLUMNS = (
+    ShoppingListItemORM.id,
+    ShoppingListItemORM.name,
+    ShoppingListItemORM.quantity,
+    ShoppingListItemORM.unit,
+    ShoppingListItemORM.notes,
+    ShoppingListItemORM.is_checked,
+    ShoppingListItemORM.created_at,
+    ShoppingListItemORM.updated_at,
+)
+_SHOPPING_FIELDS = tuple(column.key for column in _SHOPPING_COLUMNS)
+# Built once and bound per call; SQLAlchemy's compiled cache then skips recompilation.
+_SELECT_BY_ID = select(*_SHOPPING_COLUMNS).where(ShoppingListItemORM.id == bindparam("item_id"))
+_DELETE_BY_ID = (
+    delete(ShoppingListItemORM)
+    .where(ShoppingListItemORM.id == bindparam("item_id"))
+    .returning(ShoppingListItemORM.id)
+    .execution_options(synchronize_session=False)
+)
 
 
 def _to_model(row: ShoppingListItemORM) -> ShoppingListItem:
-    return ShoppingListItem.model_validate(
-        {
-            "id": row.id,
-            "name": row.name,
-            "quantity": row.quantity,
-            "unit": row.unit,
-            "notes": row.notes,
-            "is_checked": row.is_checked,
-            "created_at": row.created_at,
-            "updated_at": row.updated_at,
-        }
+    return _row_to_model(
+        (row.id, row.name, row.quantity, row.unit, row.notes, row.is_checked, row.created_at, row.updated_at)
+    )
+
+
+def _row_to_model(row: Row) -> ShoppingListItem:
+    return row_to_model(ShoppingListItem, _SHOPPING_FIELDS, row)
+
+
+def _rows_to_models(rows: Iterable[Row]) -> List[ShoppingListItem]:
+    return rows_to_models(ShoppingListItem, _SHOPPING_FIELDS, rows)
+
+
+@lru_cache(maxsize=32)
+def _update_statement(fields: Tuple[str, ...]) -> Update:
+    """Return the UPDATE ... RETURNING for one combination of changed fields.
+
+    Values are bound as ``new_<field>`` (plain column names are reserved in SET clauses).
+    """
+
+    return (
+        update(ShoppingListItemORM)
+        .where(ShoppingListItemORM.id == bindparam("item_id"))
+        .values({field: bindparam(f"new_{field}") for field in fields})
+        .returning(*_SHOPPING_COLUMNS)
+        .execution_options(synchronize_session=False)
     )
 
 
@@ -34,17 +70,14 @@ def list_shopping_items() -> List[ShoppingListItem]:
     """Return all shopping list items (unchecked items first)."""
 
     with session_scope() as session:
-        rows = (
-            session.execute(
-                select(ShoppingListItemORM).order_by(
-                    ShoppingListItemORM.is_checked.asc(),
-                    ShoppingListItemORM.created_at.asc(),
-                )
+        # Column projection: rows never become ORM instances or enter the identity map.
+        result = session.execute(
+            select(*_SHOPPING_COLUMNS).order_by(
+                ShoppingListItemORM.is_checked.asc(),
+                ShoppingListItemORM.created_at.asc(),
             )
-            .scalars()
-            .all()
         )
-        return [_to_model(row) for row in rows]
+        return _rows_to_models(result)
 
 
 def create_shopping_item(
@@ -76,32 +109,34 @@ def update_shopping_item(
     notes: str | None | object = _UNSET,
     is_checked: bool | object = _UNSET,
 ) -> ShoppingListItem:
+    values: dict[str, object] = {}
+    if name is not _UNSET:
+        values["name"] = str(name).strip()
+    if quantity is not _UNSET:
+        values["quantity"] = float(quantity) if quantity is not None else None  # type: ignore[arg-type]
+    if unit is not _UNSET:
+        values["unit"] = unit.strip() if unit else None  # type: ignore[union-attr]
+    if notes is not _UNSET:
+        values["notes"] = notes
+    if is_checked is not _UNSET:
+        values["is_checked"] = bool(is_checked)
+
+    stmt: Select | Update = _update_statement(tuple(values)) if values else _SELECT_BY_ID
+    params = {f"new_{field}": value for field, value in values.items()}
+    params["item_id"] = item_id
     with session_scope() as session:
-        db_item = session.get(ShoppingListItemORM, item_id)
-        if db_item is None:
+        # One UPDATE ... RETURNING instead of a SELECT, attribute sets, and a flushed UPDATE.
+        row = session.execute(stmt, params).first()
+        if row is None:
             raise ValueError(f"Shopping list item {item_id} not found")
-
-        if name is not _UNSET:
-            db_item.name = str(name).strip()
-        if quantity is not _UNSET:
-            db_item.quantity = float(quantity) if quantity is not None else None  # type: ignore[arg-type]
-        if unit is not _UNSET:
-            db_item.unit = unit.strip() if unit else None  # type: ignore[union-attr]
-        if notes is not _UNSET:
-            db_item.notes = notes  # type: ignore[assignment]
-        if is_checked is not _UNSET:
-            db_item.is_checked = bool(is_checked)
-
-        session.flush()
-        return _to_model(db_item)
+        return _row_to_model(row)
 
 
 def delete_shopping_item(item_id: int) -> None:
     with session_scope() as session:
-        db_item = session.get(ShoppingListItemORM, item_id)
-        if db_item is None:
+        deleted = session.execute(_DELETE_BY_ID, {"item_id": item_id}).scalar_one_or_none()
+        if deleted is None:
             raise ValueError(f"Shopping list item {item_id} not found")
-        session.delete(db_item)
 
 
 def reset_shopping_list() -> None:
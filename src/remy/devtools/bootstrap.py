@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 import venv
 from pathlib import Path
 from typing import Sequence
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 
+# Skip pip's per-invocation index lookup and interpreter warning.
+_PIP_ENV = {"PIP_DISABLE_PIP_VERSION_CHECK": "1", "PIP_NO_PYTHON_VERSION_WARNING": "1"}
+
 
 def _venv_python(venv_dir: Path) -> Path:
     if os.name == "nt":
@@ -18,7 +22,24 @@ def _venv_python(venv_dir: Path) -> Path:
 
 
 def _run(cmd: Sequence[str], cwd: Path | None = None) -> None:
-    subprocess.check_call(cmd, cwd=str(cwd) if cwd else None)
+    """Run ``cmd``, echoing its combined output line by line as it arrives."""
+
+    process = subprocess.Popen(
+        cmd,
+        cwd=str(cwd) if cwd else None,
+        env={**os.environ, **_PIP_ENV},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    with process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, list(cmd))
 
 
 def run_bootstrap(
@@ -46,18 +67,16 @@ def run_bootstrap(
         builder.create(venv_dir)
         python_executable = _venv_python(venv_dir)
 
-    commands: list[list[str]] = []
+    # One pip invocation pays interpreter startup and resolver warm-up once for both steps.
+    requirements: list[str] = []
     if upgrade_pip:
-        commands.append(
-            [str(python_executable), "-m", "pip", "install", "--upgrade", "pip"]
-        )
+        requirements += ["--upgrade", "pip"]
     if install:
-        commands.append(
-            [str(python_executable), "-m", "pip", "install", "-e", ".[dev,server]"]
-        )
+        requirements += ["-e", ".[dev,server]"]
 
     try:
-        for command in commands:
+        if requirements:
+            command = [str(python_executable), "-m", "pip", "install", *requirements]
             print(f"Running: {' '.join(command)}")
             _run(command, cwd=project_root)
     except subprocess.CalledProcessError as exc:
@@ -8,14 +8,17 @@ import platform
 import shutil
 import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Iterable, Literal, Sequence
+from typing import Callable, Iterable, Literal, Sequence
 
 Status = Literal["ok", "warn", "fail"]
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 DEFAULT_VENV = PROJECT_ROOT / ".venv"
+_CHECK_WORKERS = 8
 
 
 @dataclass(frozen=True)
@@ -93,13 +96,19 @@ def _check_command(label: str, candidates: Sequence[str]) -> CheckResult:
     )
 
 
+@lru_cache(maxsize=8)
+def _resolved_db_path(project_root: Path, database_path: Path) -> Path:
+    if database_path.is_absolute():
+        return database_path
+    return (project_root / database_path).resolve()
+
+
 def _check_database_path(project_root: Path) -> CheckResult:
     from remy.config import get_settings
 
-    settings = get_settings()
-    path = settings.database_path
-    if not path.is_absolute():
-        path = (project_root / path).resolve()
+    # get_settings() is itself memoized; keying on its path keeps this cache correct when
+    # tests clear settings and point REMY_DATABASE_PATH elsewhere.
+    path = _resolved_db_path(project_root, get_settings().database_path)
     if path.exists() or path.parent.exists():
         return CheckResult(
             name="Database directory",
@@ -114,17 +123,22 @@ def _check_database_path(project_root: Path) -> CheckResult:
 
 
 def _collect_checks(project_root: Path, venv_path: Path) -> list[CheckResult]:
-    checks: list[CheckResult] = [
-        _check_python(),
-        _check_virtualenv(venv_path),
-        _check_env_file(project_root),
-        _check_python_package("pytest"),
-        _check_python_package("ruff"),
-        _check_python_package("mypy"),
-        _check_command("Docker CLI", ["docker"]),
-        _check_command("Docker Compose", ["docker-compose"]),
-        _check_database_path(project_root),
+    probes: list[Callable[[], CheckResult]] = [
+        _check_python,
+        partial(_check_virtualenv, venv_path),
+        partial(_check_env_file, project_root),
+        partial(_check_python_package, "pytest"),
+        partial(_check_python_package, "ruff"),
+        partial(_check_python_package, "mypy"),
+        partial(_check_command, "Docker CLI", ["docker"]),
+        partial(_check_command, "Docker Compose", ["docker-compose"]),
+        partial(_check_database_path, project_root),
     ]
+    # The checks mostly wait on the filesystem (PATH walks, import finders), which releases
+    # the GIL; overlapping them costs roughly the slowest check instead of their sum.
+    # map() keeps the results in submission order.
+    with ThreadPoolExecutor(max_workers=_CHECK_WORKERS) as executor:
+        checks: list[CheckResult] = list(executor.map(lambda probe: probe(), probes))
 
     # If docker-compose standalone is missing but docker is present, treat as ok with plugin.
     docker_present = any(
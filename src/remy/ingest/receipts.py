@@ -3,17 +3,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from rapidfuzz import fuzz, process
 
 from remy import metrics
-from remy.db.inventory import create_inventory_item, list_inventory, update_inventory_item
-from remy.db.inventory_suggestions import create_suggestion
+from remy.db.inventory import apply_inventory_changes, find_inventory_items, list_inventory_match_keys
+from remy.db.inventory_suggestions import create_suggestions
+from remy.db.models import normalize_item_name
 
-
-def _normalize(value: str) -> str:
-    return " ".join(value.lower().split())
+# Matching reads inventory and the writes come afterwards, so concurrent ingests (e.g. a
+# ReceiptIngestor batch) would each miss an item the other is creating and insert it twice.
+_INGEST_LOCK = threading.Lock()
 
 
 def ingest_receipt_items(
@@ -25,18 +27,66 @@ def ingest_receipt_items(
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Insert receipt-derived items into inventory or suggestion queues."""
 
-    inventory = list_inventory()
-    inventory_by_id = {item.id: item for item in inventory if item.id is not None}
-    inventory_choices = [item.name for item in inventory if item.id is not None]
+    with _INGEST_LOCK:
+        return _ingest_receipt_items(
+            receipt_id, items, create_missing=create_missing, confidence_threshold=confidence_threshold
+        )
+
+
+def _ingest_receipt_items(
+    receipt_id: int,
+    items: List[Dict[str, Any]],
+    *,
+    create_missing: bool,
+    confidence_threshold: float,
+) -> Dict[str, List[Dict[str, Any]]]:
+    names = [(raw_item.get("name") or "").strip() for raw_item in items]
+    normalized = [normalize_item_name(name) for name in names]
+    match_ids = {raw_item["inventory_match_id"] for raw_item in items if raw_item.get("inventory_match_id")}
+
+    # Tier 1: explicit ids and exact normalized names, answered through the indexed columns.
+    known = find_inventory_items(ids=match_ids, normalized_names={key for key in normalized if key})
+    inventory_by_id = {item.id: item for item in known}
+    exact_by_name: Dict[str, Any] = {}
+    for item in known:  # ordered by id, so the oldest item wins a duplicated name
+        exact_by_name.setdefault(normalize_item_name(item.name), item)
+
+    # Tier 2: only the misses are fuzzy-matched. Inventory names (already normalized in the
+    # database) are loaded on demand and scored in one vectorized, multithreaded call.
+    fuzzy_positions = [
+        position
+        for position, (raw_item, key) in enumerate(zip(items, normalized, strict=True))
+        if key and raw_item.get("inventory_match_id") not in inventory_by_id and key not in exact_by_name
+    ]
+    candidates: List[Any] = []
+    fuzzy_rows: Dict[int, Any] = {}
+    if fuzzy_positions:
+        candidates = list_inventory_match_keys()
+        if candidates:
+            score_matrix = process.cdist(
+                [normalized[position] for position in fuzzy_positions],
+                [row.normalized_name for row in candidates],
+                scorer=fuzz.WRatio,
+                workers=-1,
+            )
+            fuzzy_rows = dict(zip(fuzzy_positions, score_matrix, strict=True))
+    # Writes are deferred until every line is classified: quantity increments for existing
+    # items and rows to insert, applied together in one transaction.
+    increments: Dict[int, float] = {}
+    new_items: List[Dict[str, Any]] = []
+    # New items are few; later lines are matched against them separately.
+    new_item_choices: List[str] = []
+    # Response entries that refer to a new item receive its id once the insert returns it.
+    new_item_entries: List[Tuple[Dict[str, Any], int]] = []
 
     ingested: List[Dict[str, Any]] = []
     metadata_ingested: List[Dict[str, Any]] = []
     skipped: List[Dict[str, Any]] = []
     suggestions: List[Dict[str, Any]] = []
     metadata_suggestions: List[Dict[str, Any]] = []
+    pending_suggestions: List[Dict[str, Any]] = []
 
-    for raw_item in items:
-        name = (raw_item.get("name") or "").strip()
+    for position, (raw_item, name) in enumerate(zip(items, names, strict=True)):
         if not name:
             skipped.append({"reason": "missing_name"})
             continue
@@ -47,66 +97,72 @@ def ingest_receipt_items(
         match_id = raw_item.get("inventory_match_id")
 
         matched_item = None
+        matched_new: Optional[int] = None
         match_score: Optional[float] = None
 
         if match_id:
             matched_item = inventory_by_id.get(match_id)
-
-        if matched_item is None and inventory_choices:
-            match = process.extractOne(name, inventory_choices, scorer=fuzz.WRatio)
-            if match:
-                matched_name, score, index = match
-                match_score = score / 100.0
-                if match_score >= confidence_threshold and index is not None:
-                    matched_item = inventory[index]
-
-        if matched_item and match_score is not None and match_score < confidence_threshold:
-            matched_item = None
-
-        if matched_item is not None:
+        if matched_item is None:
+            matched_item = exact_by_name.get(normalized[position])
+
+        if matched_item is None and (position in fuzzy_rows or new_item_choices):
+            best_item = None
+            best_new: Optional[int] = None
+            best_score = -1.0
+            row = fuzzy_rows.get(position)
+            if row is not None:
+                index = int(row.argmax())
+                best_item, best_score = candidates[index], float(row[index])
+            if new_item_choices:
+                match = process.extractOne(normalized[position], new_item_choices, scorer=fuzz.WRatio)
+                # Ties keep the pre-existing item, as a single scan over inventory + new would.
+                if match and match[1] > best_score:
+                    best_item, best_new, best_score = None, match[2], match[1]
+            match_score = best_score / 100.0
+            if match_score >= confidence_threshold:
+                matched_item, matched_new = best_item, best_new
+
+        if matched_item is not None or matched_new is not None:
             if quantity is None:
                 if create_missing:
                     quantity = 1.0
                 else:
                     skipped.append({"name": name, "reason": "missing_quantity"})
                     continue
-            existing_quantity = getattr(matched_item, "quantity", None)
-            if existing_quantity is None:
-                existing_quantity = getattr(matched_item, "qty", 0.0)
 
-            updated = update_inventory_item(
-                matched_item.id,
-                quantity=float(existing_quantity or 0.0) + float(quantity),
-            )
-            ingested.append({"id": updated.id, "action": "updated", "name": updated.name})
-            metadata_ingested.append({"name": updated.name, "quantity": quantity})
-            inventory_by_id[updated.id] = updated
+            if matched_new is not None:
+                new_items[matched_new]["quantity"] += float(quantity)
+                entry = {"id": None, "action": "updated", "name": new_items[matched_new]["name"]}
+                new_item_entries.append((entry, matched_new))
+            else:
+                increments[matched_item.id] = increments.get(matched_item.id, 0.0) + float(quantity)
+                entry = {"id": matched_item.id, "action": "updated", "name": matched_item.name}
+            ingested.append(entry)
+            metadata_ingested.append({"name": entry["name"], "quantity": quantity})
             continue
 
         if create_missing:
             resolved_quantity = float(quantity) if quantity is not None else 1.0
-            resolved_unit = unit or "count"
-            created = create_inventory_item(
-                name=name,
-                quantity=resolved_quantity,
-                unit=resolved_unit,
-            )
-            ingested.append({"id": created.id, "action": "created", "name": created.name})
-            metadata_ingested.append({"name": created.name, "quantity": resolved_quantity})
-            inventory.append(created)
-            inventory_by_id[created.id] = created
-            inventory_choices.append(created.name)
+            entry = {"id": None, "action": "created", "name": name}
+            new_item_entries.append((entry, len(new_items)))
+            new_items.append({"name": name, "quantity": resolved_quantity, "unit": unit or "count"})
+            new_item_choices.append(normalized[position])
+            ingested.append(entry)
+            metadata_ingested.append({"name": name, "quantity": resolved_quantity})
         else:
-            suggestion = create_suggestion(
-                receipt_id=receipt_id,
-                name=name,
-                quantity=quantity,
-                unit=unit,
-                confidence=match_score,
-                notes=notes,
+            pending_suggestions.append(
+                {"name": name, "quantity": quantity, "unit": unit, "confidence": match_score, "notes": notes}
             )
-            suggestions.append({"id": suggestion.id, "name": suggestion.name})
-            metadata_suggestions.append({"id": suggestion.id, "name": suggestion.name})
+
+    if increments or new_items:
+        created = apply_inventory_changes(increments, new_items)
+        for entry, index in new_item_entries:
+            entry["id"] = created[index].id
+
+    # Suggestions never feed back into matching, so write them all in one round trip.
+    for suggestion in create_suggestions(receipt_id, pending_suggestions):
+        suggestions.append({"id": suggestion.id, "name": suggestion.name})
+        metadata_suggestions.append({"id": suggestion.id, "name": suggestion.name})
 
     try:
         metrics.INGEST_ITEMS.labels(result="ingested").inc(len(ingested))
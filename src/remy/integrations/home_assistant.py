@@ -2,45 +2,136 @@
 
 from __future__ import annotations
 
+import ssl
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import httpx
 
 from remy.config import get_settings
 
+_TIMEOUT = 10.0
+_LIMITS = httpx.Limits(max_keepalive_connections=5)
+
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Return the process-wide TLS context so the CA bundle is parsed only once.
+
+    Built with httpx's own factory so trust matches an unconfigured client (certifi,
+    honouring ``SSL_CERT_FILE``/``SSL_CERT_DIR``).
+    """
+
+    return httpx.create_ssl_context()
+
+
+_NOTIFY_PATH = "/api/services/persistent_notification/create"
+_SHOPPING_ITEM_PATH = "/api/shopping_list/item"
+
 
 class HomeAssistantClient:
-    """Minimal client wrapper around the Home Assistant HTTP API."""
+    """Minimal client wrapper around the Home Assistant HTTP API.
+
+    Connections are pooled and kept alive across calls; use the client as a context manager
+    (or call ``close``/``aclose``) to release them.
+    """
 
-    def __init__(self, base_url: Optional[str] = None, token: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token: Optional[str] = None,
+        *,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
         settings = get_settings()
         self._base_url = base_url or settings.home_assistant_base_url
         self._token = token or settings.home_assistant_token
-
-    def _headers(self) -> Dict[str, str]:
-        headers = {"Content-Type": "application/json"}
+        # Set once on the pooled clients, so requests never rebuild them.
+        self._headers: Dict[str, str] = {"Content-Type": "application/json"}
         if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        return headers
+            self._headers["Authorization"] = f"Bearer {self._token}"
+        self._transport = transport
+        self._async_transport = async_transport
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
 
-    def notify(self, title: str, message: str) -> None:
-        """Send a persistent notification."""
+    def _require_base_url(self) -> str:
         if not self._base_url:
             raise RuntimeError("Home Assistant base URL is not configured.")
+        return self._base_url
 
-        endpoint = f"{self._base_url}/api/services/persistent_notification/create"
-        payload = {"title": title, "message": message}
+    def _sync_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self._require_base_url(),
+                headers=self._headers,
+                timeout=_TIMEOUT,
+                limits=_LIMITS,
+                verify=_ssl_context(),
+                transport=self._transport,
+            )
+        return self._client
+
+    def _aclient(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self._require_base_url(),
+                headers=self._headers,
+                timeout=_TIMEOUT,
+                limits=_LIMITS,
+                verify=_ssl_context(),
+                transport=self._async_transport,
+            )
+        return self._async_client
+
+    def notify(self, title: str, message: str) -> None:
+        """Send a persistent notification."""
 
-        with httpx.Client() as client:
-            client.post(endpoint, headers=self._headers(), json=payload, timeout=10.0)
+        payload = {"title": title, "message": message}
+        self._sync_client().post(_NOTIFY_PATH, json=payload)
 
     def add_shopping_item(self, name: str) -> None:
         """Add an item to the Home Assistant shopping list."""
-        if not self._base_url:
-            raise RuntimeError("Home Assistant base URL is not configured.")
 
-        endpoint = f"{self._base_url}/api/shopping_list/item"
         payload: Dict[str, Any] = {"name": name}
+        self._sync_client().post(_SHOPPING_ITEM_PATH, json=payload)
+
+    async def anotify(self, title: str, message: str) -> None:
+        """Send a persistent notification without blocking the event loop."""
+
+        payload = {"title": title, "message": message}
+        await self._aclient().post(_NOTIFY_PATH, json=payload)
+
+    async def aadd_shopping_item(self, name: str) -> None:
+        """Add an item to the Home Assistant shopping list without blocking the event loop."""
+
+        payload: Dict[str, Any] = {"name": name}
+        await self._aclient().post(_SHOPPING_ITEM_PATH, json=payload)
+
+    def close(self) -> None:
+        """Close the pooled synchronous connections."""
+
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close both the asynchronous and synchronous pooled connections."""
+
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
+    def __enter__(self) -> "HomeAssistantClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "HomeAssistantClient":
+        return self
 
-        with httpx.Client() as client:
-            client.post(endpoint, headers=self._headers(), json=payload, timeout=10.0)
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
@@ -6,35 +6,119 @@ import json
 import logging
 import re
 from datetime import datetime, timezone
-from typing import Iterable, List, Sequence
+from typing import Callable, Iterable, List, Sequence
+
+try:  # pragma: no cover - optional linear-time multi-secret matcher
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 REDACTED = "[redacted]"
 
-_BEARER_PATTERN = re.compile(r"(Bearer\s+)([A-Za-z0-9\-._~+/=]+)", re.IGNORECASE)
-_API_TOKEN_PATTERN = re.compile(r"(api_token=)([^&\s]+)", re.IGNORECASE)
-_X_API_KEY_PATTERN = re.compile(r"(X-API-Key=)([^&\s]+)", re.IGNORECASE)
+# Attributes every LogRecord carries (plus the ones formatters add). They hold code
+# locations and process metadata, never caller-supplied secrets, so only extras are scrubbed.
+_STANDARD_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", logging.INFO, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+}
+
+# Past this many distinct leading characters the prefilter costs about as much as the scan itself.
+_PREFILTER_MAX_FIRST_CHARS = 8
+
+# One alternation so every record is scanned once, not once per token pattern.
+_KNOWN_SECRET_PATTERN = re.compile(
+    r"(?P<bearer>Bearer\s+)[A-Za-z0-9\-._~+/=]+"
+    r"|(?P<api_token>api_token=)[^&\s]+"
+    r"|(?P<x_api_key>X-API-Key=)[^&\s]+",
+    re.IGNORECASE,
+)
+
+
+def _redact_match(match: re.Match[str]) -> str:
+    # Exactly one prefix group participates in any match; keep it and drop the token.
+    return match.group(match.lastindex) + REDACTED
 
 
 def _mask_known_patterns(value: str) -> str:
     """Mask standard auth token patterns."""
 
-    value = _BEARER_PATTERN.sub(r"\1" + REDACTED, value)
-    value = _API_TOKEN_PATTERN.sub(r"\1" + REDACTED, value)
-    value = _X_API_KEY_PATTERN.sub(r"\1" + REDACTED, value)
-    return value
+    # Both query-style tokens need "=" and the header needs "bearer"; most records have neither,
+    # and two substring checks are far cheaper than running the regex over the whole message.
+    if "=" not in value and "bearer" not in value.lower():
+        return value
+    return _KNOWN_SECRET_PATTERN.sub(_redact_match, value)
 
 
 def _normalize_secret(secret: str) -> str:
     return secret.strip()
 
 
-def _sanitize(message: str, secrets: Sequence[str]) -> str:
-    sanitized = _mask_known_patterns(message)
-    for secret in secrets:
-        if not secret:
-            continue
-        sanitized = sanitized.replace(secret, REDACTED)
-    return sanitized
+def _redact_spans(value: str, spans: Iterable[tuple[int, int]]) -> str:
+    """Replace each ``(start, stop)`` span with REDACTED, merging overlapping spans."""
+
+    pieces: List[str] = []
+    cursor = 0
+    for start, stop in sorted(spans):
+        if start >= cursor:
+            pieces.append(value[cursor:start])
+            pieces.append(REDACTED)
+            cursor = stop
+        elif stop > cursor:
+            cursor = stop
+    if not pieces:
+        return value
+    pieces.append(value[cursor:])
+    return "".join(pieces)
+
+
+def _build_secret_scrubber(secrets: Sequence[str]) -> Callable[[str], str]:
+    """Return a function that redacts every configured secret in a single scan."""
+
+    scrub = _build_secret_matcher(secrets)
+    first_chars = frozenset(secret[0] for secret in secrets)
+    if len(first_chars) > _PREFILTER_MAX_FIRST_CHARS:
+        return scrub
+
+    def prefiltered(value: str) -> str:
+        # A secret can only occur where its first character does; checking the whole message
+        # for a handful of characters skips the scan for nearly every record.
+        if not any(char in value for char in first_chars):
+            return value
+        return scrub(value)
+
+    return prefiltered
+
+
+def _build_secret_matcher(secrets: Sequence[str]) -> Callable[[str], str]:
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for secret in secrets:
+            automaton.add_word(secret, len(secret))
+        automaton.make_automaton()
+
+        def scrub(value: str) -> str:
+            return _redact_spans(value, ((end - length + 1, end + 1) for end, length in automaton.iter(value)))
+
+        return scrub
+
+    # Literal alternation inside a lookahead so overlapping secrets are all reported;
+    # longest first so a secret never loses to its own prefix at the same position.
+    alternation = "|".join(re.escape(secret) for secret in sorted(set(secrets), key=len, reverse=True))
+    pattern = re.compile(f"(?=({alternation}))")
+
+    def scrub_with_regex(value: str) -> str:
+        return _redact_spans(value, (match.span(1) for match in pattern.finditer(value)))
+
+    return scrub_with_regex
+
+
+def _sanitize(message: str, scrub: Callable[[str], str]) -> str:
+    return scrub(_mask_known_patterns(message))
 
 
 class SensitiveDataFilter(logging.Filter):
@@ -45,21 +129,24 @@ class SensitiveDataFilter(logging.Filter):
         self._secrets: List[str] = [
             _normalize_secret(secret) for secret in secrets if _normalize_secret(secret)
         ]
+        self._scrub = _build_secret_scrubber(self._secrets) if self._secrets else None
 
     def filter(self, record: logging.LogRecord) -> bool:  # noqa: D401 - standard interface
-        if not self._secrets:
+        if self._scrub is None:
             return True
 
         message = record.getMessage()
-        sanitized = _sanitize(message, self._secrets)
+        sanitized = _sanitize(message, self._scrub)
         if sanitized != message:
             record.msg = sanitized
             record.args = ()
 
         # Sanitize extra dict-like payloads commonly used by logging frameworks.
-        for key, value in list(vars(record).items()):
+        attributes = vars(record)
+        for key in attributes.keys() - _STANDARD_RECORD_ATTRS:
+            value = attributes[key]
             if isinstance(value, str):
-                setattr(record, key, _sanitize(value, self._secrets))
+                setattr(record, key, _sanitize(value, self._scrub))
 
         return True
 
@@ -68,8 +155,10 @@ class JsonFormatter(logging.Formatter):
     """Minimal JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:  # noqa: D401 - override
+        timestamp = datetime.fromtimestamp(record.created, tz=timezone.utc)
         payload = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            # orjson serializes aware datetimes to the same ISO 8601 text as isoformat().
+            "timestamp": timestamp if orjson is not None else timestamp.isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -84,6 +173,8 @@ class JsonFormatter(logging.Formatter):
         if record.stack_info:
             payload["stack"] = record.stack_info
 
+        if orjson is not None:
+            return orjson.dumps(payload).decode()
         return json.dumps(payload, ensure_ascii=True)
 
 
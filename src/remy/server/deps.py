@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Iterator, List, Optional, Tuple
 
 from fastapi import Depends, HTTPException, Request, status
 
@@ -28,6 +28,7 @@ from remy.db.receipts import (
     delete_receipt,
     fetch_receipt,
     fetch_receipt_blob,
+    fetch_receipt_blob_stream,
     get_receipt_ocr,
     list_receipts,
     store_receipt,
@@ -68,6 +69,7 @@ ReceiptListProvider = Callable[[], List[Receipt]]
 ReceiptStorer = Callable[[str, str | None, bytes, str | None], Receipt]
 ReceiptFetcher = Callable[[int], Receipt]
 ReceiptBlobFetcher = Callable[[int], Tuple[Receipt, bytes]]
+ReceiptBlobStreamer = Callable[[int], Tuple[Receipt, Iterator[bytes]]]
 ReceiptDeleter = Callable[[int], None]
 ReceiptOcrStatusProvider = Callable[[int], ReceiptOcrResult]
 ReceiptOcrProcessor = Callable[[int], ReceiptOcrResult]
@@ -157,6 +159,10 @@ def get_receipt_blob_fetcher() -> ReceiptBlobFetcher:
     return fetch_receipt_blob
 
 
+def get_receipt_blob_streamer() -> ReceiptBlobStreamer:
+    return fetch_receipt_blob_stream
+
+
 def get_receipt_deleter() -> ReceiptDeleter:
     return delete_receipt
 
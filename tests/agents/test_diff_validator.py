@@ -106,3 +106,81 @@ def test_diff_validator_handles_imperial_units():
     assert candidate.shopping_shortfall == []
     assert candidate.inventory_deltas
     assert abs(candidate.inventory_deltas[0].use_g - 600) < 1e-6
+
+
+def test_diff_validator_candidates_draw_from_independent_inventory():
+    validator = DiffValidator()
+    context = build_context()
+    requirement = IngredientRequirement(ingredient_id=1, name="Chicken Thigh", qty_g=400)
+    plan = Plan(
+        date=date.today(),
+        candidates=[
+            PlanCandidate(title="Option A", servings=2, ingredients_required=[requirement]),
+            PlanCandidate(title="Option B", servings=2, ingredients_required=[requirement]),
+        ],
+    )
+
+    normalized = validator.run((context, plan))
+
+    for candidate in normalized.candidates:
+        assert candidate.shopping_shortfall == []
+        assert abs(candidate.inventory_deltas[0].use_g - 400) < 1e-6
+
+
+def test_diff_validator_vectorized_path_matches_scalar(monkeypatch):
+    from remy.agents import diff_validator
+
+    context = build_context()
+    candidates = [
+        PlanCandidate(
+            title=f"Option {index}",
+            servings=2,
+            ingredients_required=[
+                IngredientRequirement(ingredient_id=1, name="Chicken Thigh", qty_g=150 + index * 10),
+                IngredientRequirement(name="Vegetable Broth", qty_ml=300),
+                IngredientRequirement(name="chicken thigh", qty_g=200),
+                IngredientRequirement(name="Lemon", qty_count=1),
+            ],
+        )
+        for index in range(20)
+    ]
+    plan = Plan(date=date.today(), candidates=candidates)
+
+    monkeypatch.setattr(diff_validator, "_VECTORIZE_MIN_REQUIREMENTS", 10**9)
+    scalar = DiffValidator().run((context, plan))
+    monkeypatch.setattr(diff_validator, "_VECTORIZE_MIN_REQUIREMENTS", 1)
+    vectorized = DiffValidator().run((context, plan))
+
+    assert vectorized == scalar
+
+
+def test_diff_validator_preserves_candidate_fields():
+    validator = DiffValidator()
+    plan = build_plan()
+
+    candidate = validator.run((build_context(), plan)).candidates[0]
+
+    assert isinstance(candidate, PlanCandidate)
+    assert candidate.title == "Braised Chicken"
+    assert candidate.estimated_time_min == 40
+    assert candidate.ingredients_required == plan.candidates[0].ingredients_required
+    assert "inventory_deltas" in candidate.model_dump(exclude_unset=True)
+
+
+def test_diff_validator_reuses_indexes_until_inventory_changes():
+    validator = DiffValidator()
+    context = build_context()
+    plan = build_plan()
+
+    first = validator.run((context, plan))
+    cached = validator._index_cache
+    assert validator.run((context, plan)) == first
+    assert validator._index_cache is cached
+
+    restocked = context.model_copy(
+        update={"inventory": [InventoryItem(id=1, name="Chicken Thigh", qty=1000, unit="g")]}
+    )
+    candidate = validator.run((restocked, plan)).candidates[0]
+    assert validator._index_cache is not cached
+    delta_by_id = {delta.ingredient_id: delta for delta in candidate.inventory_deltas}
+    assert abs(delta_by_id[1].use_g - 600) < 1e-6
@@ -0,0 +1,102 @@
+"""Tests for the receipt ingestor agent."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from remy.agents import receipt_ingestor
+from remy.agents.receipt_ingestor import ReceiptIngestor
+from remy.config import get_settings
+from remy.db.inventory import list_inventory
+from remy.db.repository import reset_repository_state
+from remy.ingest import ingest_receipt_items
+from remy.ingest import receipts as ingest_receipts
+from remy.models.receipt import ReceiptOcrResult
+
+
+class FakeOcrService:
+    def __init__(self) -> None:
+        self.threads: set[str] = set()
+
+    def process_receipt(self, receipt_id: int) -> ReceiptOcrResult:
+        self.threads.add(threading.current_thread().name)
+        # Later receipts finish first to prove results keep input order.
+        time.sleep(0.01 * (5 - receipt_id))
+        now = datetime.now(timezone.utc)
+        return ReceiptOcrResult(receipt_id=receipt_id, status="succeeded", created_at=now, updated_at=now)
+
+
+def test_receipt_ingestor_processes_batches_in_parallel_preserving_order():
+    service = FakeOcrService()
+    ingestor = ReceiptIngestor(service, max_workers=4)
+
+    results = ingestor.run([1, 2, 3, 4])
+
+    assert [result.receipt_id for result in results] == [1, 2, 3, 4]
+    assert len(service.threads) > 1
+
+
+def test_receipt_ingestor_single_receipt_runs_inline():
+    service = FakeOcrService()
+
+    results = ReceiptIngestor(service, max_workers=4).run([3])
+
+    assert [result.receipt_id for result in results] == [3]
+    assert service.threads == {threading.current_thread().name}
+
+
+@pytest.fixture()
+def isolated_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "remy.db"
+    monkeypatch.setenv("REMY_DATABASE_PATH", str(db_path))
+    get_settings.cache_clear()
+    reset_repository_state()
+    yield
+    reset_repository_state()
+    monkeypatch.delenv("REMY_DATABASE_PATH", raising=False)
+    get_settings.cache_clear()
+
+
+class IngestingOcrService:
+    """Stands in for ReceiptOcrService's auto-ingest step after OCR."""
+
+    def process_receipt(self, receipt_id: int) -> ReceiptOcrResult:
+        ingest_receipt_items(receipt_id, [{"name": "Dragon fruit", "quantity": 1}], create_missing=True)
+        now = datetime.now(timezone.utc)
+        return ReceiptOcrResult(receipt_id=receipt_id, status="succeeded", created_at=now, updated_at=now)
+
+
+def test_receipt_ingestor_batch_creates_shared_new_item_once(isolated_db, monkeypatch):
+    list_inventory()  # seed defaults before the threads race
+    find_items = ingest_receipts.find_inventory_items
+
+    def slow_find(**kwargs):
+        # Widen the window between matching and inserting so overlapping ingests would collide.
+        found = find_items(**kwargs)
+        time.sleep(0.05)
+        return found
+
+    monkeypatch.setattr(ingest_receipts, "find_inventory_items", slow_find)
+
+    ReceiptIngestor(IngestingOcrService(), max_workers=2).run([1, 2])
+
+    dragon_fruit = [item for item in list_inventory() if item.name == "Dragon fruit"]
+    assert [item.quantity for item in dragon_fruit] == [2]
+
+
+def test_default_ingestors_share_llm_client_but_not_parser(monkeypatch):
+    llm_client = object()
+    monkeypatch.setattr(receipt_ingestor, "build_receipt_llm_client", lambda: llm_client)
+    receipt_ingestor._default_llm_client.cache_clear()
+    try:
+        first, second = ReceiptIngestor(), ReceiptIngestor()
+    finally:
+        receipt_ingestor._default_llm_client.cache_clear()
+
+    assert first._ocr_service._parser is not second._ocr_service._parser
+    assert first._ocr_service._parser._llm_client is llm_client
+    assert second._ocr_service._parser._llm_client is llm_client
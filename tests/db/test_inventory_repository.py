@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import os
+from datetime import date
+
 import pytest
 
 from remy.config import get_settings
 from remy.db.inventory import (
+    _load_snapshot_data,
+    _reset_seed_cache,
     create_inventory_item,
+    delete_inventory_item,
+    find_inventory_items,
+    get_inventory_item,
+    iter_inventory,
     list_inventory,
     update_inventory_item,
 )
@@ -56,3 +65,122 @@ def test_save_inventory_item_persists_changes(isolated_db):
         db_row = session.get(InventoryItemORM, updated.id)
         assert db_row is not None
         assert db_row.quantity == 250
+
+
+def test_iter_inventory_streams_sorted_items(isolated_db):
+    create_inventory_item(name="apples", quantity=3, unit="count")
+
+    names = [item.name for item in iter_inventory()]
+
+    assert names == sorted(names)
+    assert names == [item.name for item in list_inventory()]
+
+
+def test_seed_check_skipped_once_inventory_seen(isolated_db):
+    from sqlalchemy import event
+
+    from remy.db.repository import get_engine
+
+    list_inventory()
+    list_inventory()  # marks the engine as seeded
+
+    statements: list[str] = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(get_engine(), "before_cursor_execute", listener)
+    try:
+        list_inventory()
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert "ORDER BY" in statements[0]
+
+
+def test_list_inventory_seeds_from_snapshot_file(isolated_db, tmp_path):
+    snapshot = tmp_path / "inventory_snapshot.json"
+    snapshot.write_text(
+        '[{"id": 7, "name": "leeks", "qty": 2, "unit": "count", "best_before": "2024-05-01"},'
+        ' {"name": "tofu", "quantity": 400, "unit": "g"}]',
+        encoding="utf-8",
+    )
+
+    items = list_inventory(snapshot_path=snapshot)
+
+    assert [(item.name, item.quantity) for item in items] == [("leeks", 2.0), ("tofu", 400.0)]
+    assert items[0].id == 7
+    assert str(items[0].best_before) == "2024-05-01"
+
+
+def test_snapshot_parse_cached_until_file_changes(tmp_path):
+    snapshot = tmp_path / "inventory_snapshot.json"
+    snapshot.write_text('[{"name": "leeks", "qty": 2, "unit": "count"}]', encoding="utf-8")
+
+    first = _load_snapshot_data(snapshot)
+    assert _load_snapshot_data(snapshot) is first
+
+    snapshot.write_text('[{"name": "tofu", "qty": 1, "unit": "count"}]', encoding="utf-8")
+    stat = snapshot.stat()
+    os.utime(snapshot, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [row["name"] for row in _load_snapshot_data(snapshot)] == ["tofu"]
+
+
+def test_snapshot_seed_keeps_last_row_for_repeated_id(isolated_db, tmp_path):
+    snapshot = tmp_path / "inventory_snapshot.json"
+    snapshot.write_text(
+        '[{"name": "onions", "qty": 3, "unit": "count"},'
+        ' {"id": 1, "name": "leeks", "qty": 2, "unit": "count"},'
+        ' {"id": 1, "name": "leeks", "qty": 5, "unit": "count"}]',
+        encoding="utf-8",
+    )
+
+    items = {item.name: item for item in list_inventory(snapshot_path=snapshot)}
+
+    assert items["leeks"].id == 1
+    assert items["leeks"].quantity == 5.0
+    assert items["onions"].id != 1
+
+
+def test_reset_seed_cache_reseeds_emptied_table(isolated_db):
+    list_inventory()
+    list_inventory()
+    with session_scope() as session:
+        session.query(InventoryItemORM).delete()
+
+    assert list_inventory() == []
+
+    _reset_seed_cache()
+    assert len(list_inventory()) == 3
+
+
+def test_update_and_delete_missing_item_raise(isolated_db):
+    with pytest.raises(ValueError):
+        update_inventory_item(9999, quantity=1)
+    with pytest.raises(ValueError):
+        delete_inventory_item(9999)
+
+
+def test_update_clears_best_before_and_delete_removes_row(isolated_db):
+    saved = create_inventory_item(name="yogurt", quantity=1, unit="count", best_before=date(2024, 6, 1))
+
+    assert update_inventory_item(saved.id, best_before=None).best_before is None
+    assert update_inventory_item(saved.id).name == "yogurt"
+
+    delete_inventory_item(saved.id)
+    assert get_inventory_item(saved.id) is None
+
+
+def test_find_inventory_items_uses_normalized_names(isolated_db):
+    list_inventory()  # seed defaults before adding our own row
+    created = create_inventory_item(name="Greek  Yogurt", quantity=1, unit="tub")
+
+    assert [item.name for item in find_inventory_items(normalized_names=["greek yogurt"])] == ["Greek  Yogurt"]
+    assert [item.id for item in find_inventory_items(ids=[1], normalized_names=["broccoli"])] == [1, 2]
+    assert find_inventory_items() == []
+
+    update_inventory_item(created.id, name="Skyr")
+    assert find_inventory_items(normalized_names=["greek yogurt"]) == []
+    assert [item.id for item in find_inventory_items(normalized_names=["skyr"])] == [created.id]
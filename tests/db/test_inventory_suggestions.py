@@ -8,7 +8,9 @@ from remy.config import get_settings
 from remy.db.inventory import list_inventory
 from remy.db.inventory_suggestions import (
     approve_suggestion,
+    count_suggestions,
     create_suggestion,
+    create_suggestions,
     delete_suggestion,
     list_suggestions,
 )
@@ -39,6 +41,7 @@ def test_create_list_and_delete_suggestion(isolated_db):
     assert suggestion.receipt_id == 1
     suggestions = list_suggestions()
     assert len(suggestions) == 1
+    assert count_suggestions() == 1
     assert suggestions[0].name == "Test Item"
 
     delete_suggestion(suggestion.id)
@@ -61,3 +64,20 @@ def test_approve_suggestion_creates_inventory(isolated_db):
 
     with pytest.raises(ValueError):
         delete_suggestion(suggestion.id)
+
+
+def test_create_suggestions_bulk_preserves_order(isolated_db):
+    created = create_suggestions(
+        3,
+        [
+            {"name": "  Oat  Milk ", "quantity": 2, "unit": "l", "confidence": 0.4},
+            {"name": "Basil"},
+        ],
+    )
+
+    assert [item.name for item in created] == ["  Oat  Milk ", "Basil"]
+    assert created[0].normalized_name == "oat milk"
+    assert created[1].quantity is None
+    assert all(item.id and item.created_at for item in created)
+    assert {item.id for item in list_suggestions()} == {item.id for item in created}
+    assert create_suggestions(3, []) == []
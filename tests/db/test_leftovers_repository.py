@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from remy.config import get_settings
+from remy.db.leftovers import (
+    count_leftovers,
+    create_leftover_item,
+    delete_leftover_item,
+    list_leftovers,
+    update_leftover_item,
+)
+from remy.db.repository import reset_repository_state
+
+
+@pytest.fixture()
+def isolated_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "remy.db"
+    monkeypatch.setenv("REMY_DATABASE_PATH", str(db_path))
+    get_settings.cache_clear()
+    reset_repository_state()
+    yield
+    reset_repository_state()
+    monkeypatch.delenv("REMY_DATABASE_PATH", raising=False)
+    get_settings.cache_clear()
+
+
+def test_list_leftovers_orders_by_urgency(isolated_db):
+    create_leftover_item(name="soup", quantity=2, unit="portion")
+    create_leftover_item(name="curry", quantity=1, unit="portion", best_before=date(2025, 1, 3), notes="spicy")
+    create_leftover_item(name="rice", quantity=300, unit="g", best_before=date(2025, 1, 2), notes="")
+
+    items = list_leftovers()
+
+    assert [item.name for item in items] == ["rice", "curry", "soup"]
+    assert count_leftovers() == 3
+    assert items[0].notes is None
+    assert items[1].notes == "spicy"
+    assert items[1].quantity == 1.0
+
+
+def test_update_leftover_item_changes_quantity(isolated_db):
+    created = create_leftover_item(name="chili", quantity=3, unit="portion")
+
+    updated = update_leftover_item(created.id, quantity=1)
+
+    assert updated.quantity == 1.0
+    assert [item.quantity for item in list_leftovers()] == [1.0]
+
+
+def test_delete_leftover_item_removes_row(isolated_db):
+    created = create_leftover_item(name="lasagna", quantity=2, unit="portion")
+
+    delete_leftover_item(created.id)
+
+    assert list_leftovers() == []
+    with pytest.raises(ValueError):
+        delete_leftover_item(created.id)
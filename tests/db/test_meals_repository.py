@@ -5,7 +5,7 @@ from datetime import date
 import pytest
 
 from remy.config import get_settings
-from remy.db.meals import delete_meal, list_recent_meals, record_meal
+from remy.db.meals import count_meals, delete_meal, list_recent_meals, record_meal
 from remy.db.repository import reset_repository_state
 from remy.models.context import RecentMeal
 
@@ -36,6 +36,7 @@ def test_record_and_list_meals(isolated_db):
 
     meals_after = list_recent_meals()
     assert meals_after[0].rating == 5
+    assert count_meals() == 1
 
 
 def test_delete_meal(isolated_db):
@@ -33,3 +33,13 @@ def test_preferences_round_trip(isolated_db):
     assert loaded.diet == "vegan"
     assert loaded.max_time_min == 30
     assert loaded.allergens == ["peanut"]
+
+
+def test_save_preferences_overwrites_existing_keys(isolated_db):
+    save_preferences(Preferences(diet="vegan", max_time_min=30, allergens=["peanut"]))
+    save_preferences(Preferences(diet=None, max_time_min=45, allergens=[]))
+
+    loaded = load_preferences()
+    assert loaded.diet is None
+    assert loaded.max_time_min == 45
+    assert loaded.allergens == []
@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
+import random
+import re
+from datetime import datetime, timedelta
+
 import pytest
 
 from remy.config import get_settings
+from remy.db.models import ReceiptOcrResultORM, ReceiptORM
 from remy.db.receipts import (
     claim_receipts_for_ocr,
+    count_receipts,
     delete_receipt,
     fetch_receipt,
     fetch_receipt_blob,
+    fetch_receipt_blob_stream,
     get_receipt_ocr,
     list_receipts,
     offload_receipt_content,
     store_receipt,
     update_receipt_ocr,
 )
-from remy.db.repository import reset_repository_state
+from remy.db.repository import reset_repository_state, session_scope
 
 
 @pytest.fixture()
@@ -44,6 +51,7 @@ def test_store_and_list_receipts(isolated_db):
 
     receipts = list_receipts()
     assert len(receipts) == 1
+    assert count_receipts() == 1
     assert receipts[0].filename == "receipt.txt"
     ocr_status = get_receipt_ocr(receipt.id)
     assert ocr_status.status == "pending"
@@ -88,6 +96,10 @@ def test_fetch_and_delete_receipt(isolated_db, tmp_path):
 
     with pytest.raises(ValueError):
         get_receipt_ocr(saved.id)
+    with pytest.raises(ValueError):
+        delete_receipt(saved.id)
+    with session_scope() as session:
+        assert session.get(ReceiptOcrResultORM, saved.id) is None
 
     receipts = list_receipts()
     assert receipts == []
@@ -115,3 +127,52 @@ def test_claim_receipts_for_ocr(isolated_db):
     update_receipt_ocr(first.id, status="failed")
     retry_claim = claim_receipts_for_ocr(limit=5)
     assert first.id in retry_claim
+
+
+def test_offload_streams_multi_chunk_blob(isolated_db, tmp_path):
+    # Incompressible, so it is stored raw and compressed on offload; 256 KiB spans several read chunks.
+    content = random.Random(0).randbytes(256 * 1024)
+    saved = store_receipt(filename="big.bin", content_type="application/octet-stream", content=content)
+
+    archive_dir = tmp_path / "archive"
+    offload_path = offload_receipt_content(saved.id, archive_dir=archive_dir)
+
+    assert offload_path is not None
+    assert re.fullmatch(rf"receipt_{saved.id}_[0-9a-f]{{16}}\.bin\.(zst|gz)", offload_path.name)
+    assert [path.name for path in archive_dir.iterdir()] == [offload_path.name]
+    assert fetch_receipt_blob(saved.id)[1] == content
+    _, chunks = fetch_receipt_blob_stream(saved.id)
+    chunks = list(chunks)
+    assert len(chunks) > 1
+    assert b"".join(chunks) == content
+    # A second offload is a no-op that reports the existing archive.
+    assert offload_receipt_content(saved.id, archive_dir=archive_dir) == offload_path
+
+
+def test_compressible_content_is_stored_with_zstd(isolated_db, tmp_path):
+    pytest.importorskip("zstandard")
+    content = b"MILK 2.49\nBREAD 3.10\n" * 2048
+    saved = store_receipt(filename="text.txt", content_type="text/plain", content=content)
+
+    assert saved.size_bytes == len(content)
+    with session_scope() as session:
+        record = session.get(ReceiptORM, saved.id)
+        assert record.content_encoding == "zstd"
+        assert len(record.content) < len(content)
+    assert fetch_receipt_blob(saved.id)[1] == content
+
+    offload_path = offload_receipt_content(saved.id, archive_dir=tmp_path / "archive")
+    assert offload_path is not None and offload_path.name.endswith(".bin.zst")
+    assert fetch_receipt_blob(saved.id)[1] == content
+
+
+def test_claim_receipts_for_ocr_returns_oldest_first(isolated_db):
+    receipts = [
+        store_receipt(filename=f"{index}.png", content_type="image/png", content=b"\x89PNG\r\n\x1a\n")
+        for index in range(3)
+    ]
+    with session_scope() as session:
+        for age, receipt in zip((1, 3, 2), receipts, strict=True):
+            session.get(ReceiptOcrResultORM, receipt.id).updated_at = datetime(2024, 1, 1) - timedelta(days=age)
+
+    assert claim_receipts_for_ocr(limit=5) == [receipts[1].id, receipts[2].id, receipts[0].id]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import text
+
+from remy.config import get_settings
+from remy.db.repository import reset_repository_state, row_to_model, rows_to_models, session_scope
+from remy.models.context import RecentMeal
+
+
+@pytest.fixture()
+def isolated_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "remy.db"
+    monkeypatch.setenv("REMY_DATABASE_PATH", str(db_path))
+    get_settings.cache_clear()
+    reset_repository_state()
+    yield
+    reset_repository_state()
+    monkeypatch.delenv("REMY_DATABASE_PATH", raising=False)
+    get_settings.cache_clear()
+
+
+def test_connections_use_wal_and_normal_sync(isolated_db):
+    with session_scope() as session:
+        assert session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # 1 == NORMAL
+        assert session.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert session.execute(text("PRAGMA temp_store")).scalar() == 2
+
+
+def test_sessions_reuse_pooled_connections(isolated_db):
+    with session_scope() as session:
+        first = session.connection().connection.dbapi_connection
+    with session_scope() as session:
+        second = session.connection().connection.dbapi_connection
+
+    assert first is second
+
+
+def test_engine_adds_content_path_to_legacy_receipts_table(tmp_path, monkeypatch):
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE receipts (id INTEGER PRIMARY KEY, filename VARCHAR(255) NOT NULL, "
+            "content_type VARCHAR(255), size_bytes INTEGER NOT NULL, content BLOB, notes TEXT, "
+            "uploaded_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL)"
+        )
+    monkeypatch.setenv("REMY_DATABASE_PATH", str(db_path))
+    get_settings.cache_clear()
+    reset_repository_state()
+    try:
+        with session_scope() as session:
+            columns = {row[1] for row in session.execute(text("PRAGMA table_info(receipts)"))}
+    finally:
+        reset_repository_state()
+        get_settings.cache_clear()
+
+    assert "content_path" in columns
+
+
+def test_engine_backfills_normalized_names_on_legacy_inventory(tmp_path, monkeypatch):
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE inventory_items (id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+            "quantity FLOAT NOT NULL, unit VARCHAR(64) NOT NULL, best_before DATE, notes TEXT, "
+            "created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, "
+            "updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL)"
+        )
+        connection.execute("INSERT INTO inventory_items (name, quantity, unit) VALUES ('  Brown  RICE ', 1, 'kg')")
+    monkeypatch.setenv("REMY_DATABASE_PATH", str(db_path))
+    get_settings.cache_clear()
+    reset_repository_state()
+    try:
+        with session_scope() as session:
+            normalized = session.execute(text("SELECT normalized_name FROM inventory_items")).scalars().all()
+            indexes = set(session.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars())
+    finally:
+        reset_repository_state()
+        get_settings.cache_clear()
+
+    assert normalized == ["brown rice"]
+    assert "ix_inventory_items_normalized_name" in indexes
+
+
+def test_engine_creates_declared_indexes(isolated_db):
+    with session_scope() as session:
+        names = set(session.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars())
+
+    assert {"ix_inventory_items_name", "ix_leftovers_urgency", "ix_inventory_suggestions_normalized_name"} <= names
+
+
+def test_get_session_is_rebound_to_factory_until_reset(isolated_db):
+    from remy.db import repository
+
+    engine = repository.get_engine()
+    assert repository.get_session is repository._session_factory
+    with repository.session_scope() as session:
+        assert session.get_bind() is engine
+
+    reset_repository_state()
+    assert repository.get_session is repository._lazy_get_session
+
+
+def test_row_helpers_validate_rows_into_models():
+    fields = ("date", "title", "rating", "notes")
+
+    (meal,) = rows_to_models(RecentMeal, fields, [("2024-05-01", "Soup", 4, None)])
+    assert meal == RecentMeal(date=date(2024, 5, 1), title="Soup", rating=4)
+
+    with pytest.raises(ValidationError):
+        row_to_model(RecentMeal, fields, (date(2024, 5, 1), "Soup", 9, None))
+    with pytest.raises(ValueError):
+        row_to_model(RecentMeal, fields, (date(2024, 5, 1), "Soup"))
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import pytest
 
+from remy.db.models import ShoppingListItemORM
+from remy.db.repository import session_scope
 from remy.db.shopping_list import (
+    _to_model,
     create_shopping_item,
     delete_shopping_item,
     get_shopping_item,
@@ -12,6 +15,7 @@ from remy.db.shopping_list import (
     reset_shopping_list,
     update_shopping_item,
 )
+from remy.models.shopping import ShoppingListItem
 
 
 def test_create_and_list_shopping_items():
@@ -55,3 +59,30 @@ def test_reset_shopping_list():
 def test_update_missing_item_raises():
     with pytest.raises(ValueError):
         update_shopping_item(999, name="nope")
+
+
+def test_to_model_matches_validated_item():
+    item = create_shopping_item(name="butter", quantity=1, unit="block", notes="unsalted")
+
+    with session_scope() as session:
+        row = session.get(ShoppingListItemORM, item.id)
+        constructed = _to_model(row)
+        validated = ShoppingListItem.model_validate(row, from_attributes=True)
+
+    assert constructed == validated
+    assert constructed.model_dump() == validated.model_dump()
+
+
+def test_update_refreshes_timestamp_and_delete_missing_raises():
+    item = create_shopping_item(name="yogurt", quantity=1, unit="tub")
+
+    updated = update_shopping_item(item.id, name="  greek yogurt ")
+    unchanged = update_shopping_item(item.id)
+
+    assert updated.name == "greek yogurt"
+    assert updated.updated_at >= item.updated_at
+    assert unchanged == updated
+
+    delete_shopping_item(item.id)
+    with pytest.raises(ValueError):
+        delete_shopping_item(item.id)
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import os
+import subprocess
+import sys
 
-from remy.devtools.bootstrap import run_bootstrap
-from remy.devtools.doctor import run_doctor
+import pytest
+
+from remy.devtools.bootstrap import _run, run_bootstrap
+from remy.devtools.doctor import _collect_checks, run_doctor
 
 
 def test_doctor_generates_report():
@@ -15,6 +19,22 @@ def test_doctor_generates_report():
     assert "Summary" in report
 
 
+def test_doctor_checks_keep_their_order(tmp_path):
+    names = [result.name for result in _collect_checks(tmp_path, tmp_path / ".venv")]
+
+    assert names == [
+        "Python",
+        "Virtual environment",
+        ".env file",
+        "Python package: pytest",
+        "Python package: ruff",
+        "Python package: mypy",
+        "Docker CLI",
+        "Docker Compose",
+        "Database directory",
+    ]
+
+
 def test_bootstrap_creates_virtualenv(tmp_path, monkeypatch):
     project_root = tmp_path / "project"
     project_root.mkdir()
@@ -38,3 +58,32 @@ def test_bootstrap_creates_virtualenv(tmp_path, monkeypatch):
     bin_dir = "Scripts" if os.name == "nt" else "bin"
     python_path = venv_dir / bin_dir / ("python.exe" if os.name == "nt" else "python")
     assert python_path.exists()
+
+
+def test_bootstrap_run_streams_output_and_raises_on_failure(capsys):
+    script = (
+        "import os, sys; "
+        "print(os.environ['PIP_DISABLE_PIP_VERSION_CHECK'], flush=True); "
+        "sys.stderr.write('warn\\n')"
+    )
+    _run([sys.executable, "-c", script])
+    assert capsys.readouterr().out.splitlines() == ["1", "warn"]
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        _run([sys.executable, "-c", "raise SystemExit(3)"])
+    assert excinfo.value.returncode == 3
+
+
+def test_bootstrap_installs_in_a_single_pip_invocation(tmp_path, monkeypatch):
+    venv_dir = tmp_path / ".venv"
+    python_path = venv_dir / ("Scripts" if os.name == "nt" else "bin") / ("python.exe" if os.name == "nt" else "python")
+    python_path.parent.mkdir(parents=True)
+    python_path.write_text("")
+    commands = []
+    monkeypatch.setattr("remy.devtools.bootstrap._run", lambda cmd, cwd=None: commands.append(cmd))
+
+    assert run_bootstrap(venv_dir=venv_dir, project_root=tmp_path) == 0
+
+    assert commands == [
+        [str(python_path), "-m", "pip", "install", "--upgrade", "pip", "-e", ".[dev,server]"]
+    ]
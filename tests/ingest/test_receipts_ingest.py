@@ -0,0 +1,102 @@
+"""Tests for turning parsed receipt lines into inventory updates."""
+
+from __future__ import annotations
+
+import pytest
+
+from remy.config import get_settings
+from remy.db.inventory import list_inventory
+from remy.db.inventory_suggestions import list_suggestions
+from remy.db.repository import reset_repository_state
+from remy.ingest import ingest_receipt_items
+from remy.ingest import receipts as ingest_receipts
+
+
+@pytest.fixture()
+def isolated_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "remy.db"
+    monkeypatch.setenv("REMY_DATABASE_PATH", str(db_path))
+    get_settings.cache_clear()
+    reset_repository_state()
+    yield
+    reset_repository_state()
+    monkeypatch.delenv("REMY_DATABASE_PATH", raising=False)
+    get_settings.cache_clear()
+
+
+def test_fuzzy_matches_ignore_case_and_spacing(isolated_db):
+    result = ingest_receipt_items(
+        1,
+        [
+            {"name": "  BROCCOLI ", "quantity": 100, "unit": "g"},
+            {"name": "Brown   Rice", "quantity": 250, "unit": "g"},
+        ],
+        create_missing=False,
+    )
+
+    assert [entry["action"] for entry in result["ingested"]] == ["updated", "updated"]
+    quantities = {item.name: item.quantity for item in list_inventory()}
+    assert quantities["broccoli"] == 500
+    assert quantities["brown rice"] == 1000
+
+
+def test_items_created_during_ingest_are_matched_by_later_lines(isolated_db):
+    result = ingest_receipt_items(
+        1,
+        [
+            {"name": "Saffron threads", "quantity": 1, "unit": "g"},
+            {"name": "saffron threads", "quantity": 2, "unit": "g"},
+        ],
+        create_missing=True,
+    )
+
+    assert [entry["action"] for entry in result["ingested"]] == ["created", "updated"]
+    saffron = [item for item in list_inventory() if item.name == "Saffron threads"]
+    assert [item.quantity for item in saffron] == [3]
+
+
+def test_unmatched_items_become_suggestions_with_confidence(isolated_db):
+    result = ingest_receipt_items(1, [{"name": "dragon fruit", "quantity": 1}], create_missing=False)
+
+    assert not result["ingested"]
+    [suggestion] = list_suggestions()
+    assert suggestion.name == "dragon fruit"
+    assert suggestion.confidence is not None and suggestion.confidence < 0.85
+
+
+def test_repeated_lines_accumulate_and_created_ids_are_reported(isolated_db):
+    result = ingest_receipt_items(
+        1,
+        [
+            {"name": "broccoli", "quantity": 100},
+            {"name": "Broccoli", "quantity": 50},
+            {"name": "oat milk", "quantity": 1, "unit": "l"},
+        ],
+        create_missing=True,
+    )
+
+    inventory = {item.name: item for item in list_inventory()}
+    assert inventory["broccoli"].quantity == 550
+    assert result["ingested"][-1] == {"id": inventory["oat milk"].id, "action": "created", "name": "oat milk"}
+
+
+def test_exact_and_explicit_matches_skip_the_full_inventory_scan(isolated_db, monkeypatch):
+    def fail_full_scan(*args, **kwargs):
+        raise AssertionError("fuzzy tier should not run")
+
+    monkeypatch.setattr(ingest_receipts, "list_inventory_match_keys", fail_full_scan)
+
+    result = ingest_receipt_items(
+        1,
+        [
+            {"name": "Brown Rice", "quantity": 50},
+            {"name": "Receipt label", "quantity": 10, "inventory_match_id": 1},
+        ],
+        create_missing=False,
+    )
+
+    monkeypatch.undo()
+    assert [entry["id"] for entry in result["ingested"]] == [3, 1]
+    quantities = {item.id: item.quantity for item in list_inventory()}
+    assert quantities[3] == 800
+    assert quantities[1] == 610
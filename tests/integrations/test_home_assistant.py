@@ -0,0 +1,84 @@
+"""Tests for the Home Assistant client."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+
+import httpx
+import pytest
+
+from remy.integrations import home_assistant
+from remy.integrations.home_assistant import HomeAssistantClient
+
+
+def test_sync_calls_share_one_pooled_client():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    with HomeAssistantClient("http://ha.local", "token", transport=httpx.MockTransport(handler)) as client:
+        client.notify("Dinner", "Tacos tonight")
+        pooled = client._client
+        client.add_shopping_item("tortillas")
+        assert client._client is pooled
+
+    assert client._client is None
+    assert [request.url.path for request in requests] == [
+        "/api/services/persistent_notification/create",
+        "/api/shopping_list/item",
+    ]
+    assert requests[0].headers["Authorization"] == "Bearer token"
+
+
+def test_async_calls_use_async_client():
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    async def run() -> None:
+        async with HomeAssistantClient(
+            "http://ha.local", async_transport=httpx.MockTransport(handler)
+        ) as client:
+            await client.anotify("Dinner", "Tacos tonight")
+            await client.aadd_shopping_item("limes")
+
+    asyncio.run(run())
+
+    assert [request.url.path for request in requests] == [
+        "/api/services/persistent_notification/create",
+        "/api/shopping_list/item",
+    ]
+
+
+def test_missing_base_url_raises():
+    client = HomeAssistantClient()
+    client._base_url = None  # independent of any configured environment
+
+    with pytest.raises(RuntimeError):
+        client.notify("Dinner", "Tacos tonight")
+
+
+def test_ssl_context_honours_ssl_cert_file(monkeypatch):
+    certifi = pytest.importorskip("certifi")
+    calls = []
+    real_load = ssl.SSLContext.load_verify_locations
+
+    def recording_load(self, *args, **kwargs):
+        calls.append(kwargs.get("cafile", args[0] if args else None))
+        return real_load(self, *args, **kwargs)
+
+    monkeypatch.setenv("SSL_CERT_FILE", certifi.where())
+    monkeypatch.setattr(ssl.SSLContext, "load_verify_locations", recording_load)
+    home_assistant._ssl_context.cache_clear()
+    try:
+        context = home_assistant._ssl_context()
+    finally:
+        home_assistant._ssl_context.cache_clear()
+
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert certifi.where() in calls
@@ -0,0 +1,101 @@
+"""Tests for the receipt LLM client."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from remy.models.receipt import ReceiptLineItem
+from remy.ocr import llm_client
+from remy.ocr.llm_client import ReceiptLLMClient
+
+
+def _client() -> ReceiptLLMClient:
+    return ReceiptLLMClient(
+        base_url="http://llm.local/v1",
+        model="test-model",
+        provider="openai",
+        temperature=0.0,
+        max_tokens=256,
+    )
+
+
+def test_parse_items_coerces_loose_llm_entries(monkeypatch):
+    client = _client()
+    content = """Here you go:
+```json
+{"items": [
+  {"name": "Organic Baby Spinach", "raw_text": "ORG SPNCH", "quantity": "2", "unit": "", "total_price": 3.99},
+  {"raw_text": "MYSTERY ITEM", "quantity": "a few", "confidence": 0},
+  {"name": "  "}
+]}
+```"""
+    monkeypatch.setattr(client, "_execute_chat", lambda payload: content)
+
+    items = client.parse_items("ORG SPNCH 3.99", [])
+
+    assert [(item.name, item.quantity, item.unit, item.confidence) for item in items] == [
+        ("Organic Baby Spinach", 2.0, None, 0.85),
+        ("MYSTERY ITEM", None, None, 0.85),
+    ]
+
+
+def test_parse_items_rejects_invalid_json(monkeypatch):
+    client = _client()
+    monkeypatch.setattr(client, "_execute_chat", lambda payload: '{"items": [oops]}')
+
+    with pytest.raises(ValueError, match="invalid JSON"):
+        client.parse_items("text", [])
+
+
+def test_chat_requests_reuse_one_pooled_client():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        content = '{"items": [{"name": "Milk", "total_price": 3.99}]}'
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    with ReceiptLLMClient(
+        base_url="http://llm.local/v1",
+        model="test-model",
+        provider="openai",
+        temperature=0.0,
+        max_tokens=256,
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        assert [item.name for item in client.parse_items("MILK 3.99", [])] == ["Milk"]
+        pooled = client._client
+        client.parse_items("MILK 3.99", [])
+        assert client._client is pooled
+
+    assert client._client is None
+    assert [str(request.url) for request in requests] == ["http://llm.local/v1/chat/completions"] * 2
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_build_payload_embeds_indented_baseline(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(llm_client, "orjson", None)
+    baseline = [ReceiptLineItem(raw_text="CRÈME FRAÎCHE 3.99", name="Crème fraîche", quantity=2.0, total_price=3.99)]
+
+    payload = _client()._build_payload("CRÈME FRAÎCHE 3.99", baseline)
+
+    expected = json.dumps(
+        [
+            {
+                "raw_text": "CRÈME FRAÎCHE 3.99",
+                "name": "Crème fraîche",
+                "quantity": 2.0,
+                "unit": None,
+                "total_price": 3.99,
+            }
+        ],
+        ensure_ascii=False,
+        indent=2,
+    )
+    assert expected in payload["user"]
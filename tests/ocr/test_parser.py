@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 from typing import Any
@@ -11,6 +12,7 @@ import pytest
 
 from remy.models.context import InventoryItem
 from remy.models.receipt import ReceiptLineItem
+from remy.ocr import parser as parser_module
 from remy.ocr.parser import ReceiptParser
 
 FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "receipts"
@@ -177,3 +179,52 @@ def test_llm_enhancements_merge_with_existing_items():
     assert match is not None
     assert match.quantity == 2.0
     assert match.unit.lower() == "pint"
+
+
+class _CountingReceiptLLM:
+    def __init__(self, *, fail: bool = False):
+        self.calls = 0
+        self._fail = fail
+
+    def parse_items(self, ocr_text, baseline_items):
+        self.calls += 1
+        if self._fail:
+            raise RuntimeError("llm unavailable")
+        return []
+
+
+def test_parser_reuses_result_for_repeated_text():
+    llm = _CountingReceiptLLM()
+    parser = ReceiptParser(inventory_provider=lambda: [], llm_client=llm)
+    text = "FRESH MART\nMilk Whole 1L 3.99\nTotal 3.99"
+
+    first = parser.parse(text)
+    first.items[0].name = "changed by caller"
+    second = parser.parse(text)
+
+    assert llm.calls == 1
+    assert second.items[0].name == "Milk Whole 1L"
+    assert second.total == 3.99
+
+
+def test_parser_does_not_cache_failed_llm_enhancement():
+    llm = _CountingReceiptLLM(fail=True)
+    parser = ReceiptParser(inventory_provider=lambda: [], llm_client=llm)
+
+    parser.parse("Milk 3.99")
+    parser.parse("Milk 3.99")
+
+    assert llm.calls == 2
+
+
+def test_parser_cache_is_safe_to_share_across_threads(monkeypatch):
+    monkeypatch.setattr(parser_module, "_PARSE_CACHE_SIZE", 4)
+    parser = ReceiptParser(inventory_provider=lambda: [])
+    texts = [f"Item {index} {index}.99" for index in range(64)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(parser.parse, texts * 4))
+
+    prices = [result.items[0].total_price for result in results[:64]]
+    assert prices == pytest.approx([index + 0.99 for index in range(64)])
+    assert len(parser._parse_cache) <= 4
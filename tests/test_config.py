@@ -0,0 +1,65 @@
+"""Tests for environment-driven settings."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from remy.config import _converter_for, _parse_env_file, get_settings
+
+
+def test_settings_read_env_overrides_and_fallback_keys(monkeypatch):
+    monkeypatch.setenv("REMY_OCR_WORKER_BATCH_SIZE", "9")
+    monkeypatch.setenv("REMY_LOG_REQUESTS", "off")
+    monkeypatch.setenv("REMY_VLLM_BASE_URL", "http://vllm:8000/v1")
+    monkeypatch.setenv("REMY_RAG_INDEX_PATH", "/tmp/remy.ann")
+    get_settings.cache_clear()
+
+    settings = get_settings()
+
+    assert settings.ocr_worker_batch_size == 9
+    assert settings.log_requests is False
+    assert settings.planner_llm_base_url == "http://vllm:8000/v1"
+    assert settings.rag_index_path == Path("/tmp/remy.ann")
+
+
+def test_settings_ignore_unparsable_numbers(monkeypatch):
+    monkeypatch.setenv("REMY_LLM_TEMPERATURE", "warm")
+    monkeypatch.setenv("REMY_RAG_TOP_K", "")
+    get_settings.cache_clear()
+
+    settings = get_settings()
+
+    assert settings.planner_llm_temperature == 0.2
+    assert settings.rag_top_k == 3
+
+
+def test_env_file_parsing_and_cache_refresh(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# comment\nREMY_LOG_LEVEL = DEBUG \nREMY_API_TOKEN=\nnot a pair\nREMY_OCR_LANG=deu\r\n",
+        encoding="utf-8",
+    )
+    assert _parse_env_file(env_file) == {
+        "REMY_LOG_LEVEL": "DEBUG",
+        "REMY_API_TOKEN": "",
+        "REMY_OCR_LANG": "deu",
+    }
+
+    env_file.write_text("REMY_LOG_LEVEL=WARNING\n", encoding="utf-8")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _parse_env_file(env_file) == {"REMY_LOG_LEVEL": "WARNING"}
+    assert _parse_env_file(tmp_path / "missing.env") == {}
+
+
+def test_converters_resolve_any_optional_spelling():
+    assert _converter_for("path", Optional[Path]) is Path
+    assert _converter_for("path", Path | None) is Path
+    assert _converter_for("count", int | None)("7") == 7
+
+    with pytest.raises(TypeError, match=r"Settings\.tags has unsupported type"):
+        _converter_for("tags", list[str])
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import logging
 
 import pytest
 
-from remy.logging_utils import configure_logging
+from remy import logging_utils
+from remy.logging_utils import JsonFormatter, SensitiveDataFilter, _mask_known_patterns, configure_logging
 
 
 @pytest.mark.parametrize("fmt", ["plain", "json"])
@@ -31,3 +33,95 @@ def test_sensitive_data_filter_redacts_tokens(fmt):
     formatted = handler.format(record)
     assert secret not in formatted
     assert "[redacted]" in formatted
+
+
+def test_mask_known_patterns_redacts_every_token_kind_in_one_pass():
+    message = "auth=bearer abc.def url=/x?api_token=t0k&X-API-KEY=k3y&page=2"
+
+    assert _mask_known_patterns(message) == (
+        "auth=bearer [redacted] url=/x?api_token=[redacted]&X-API-KEY=[redacted]&page=2"
+    )
+    assert _mask_known_patterns("nothing to hide") == "nothing to hide"
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_sensitive_data_filter_redacts_overlapping_secrets(monkeypatch, use_automaton):
+    if use_automaton:
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(logging_utils, "ahocorasick", None)
+    filter_ = SensitiveDataFilter(["abc123", "c123xyz", " ", "tok"])
+    record = logging.LogRecord(
+        name="remy.test.redaction",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=0,
+        msg="key=abc123xyz then tok, tok",
+        args=(),
+        exc_info=None,
+    )
+    record.detail = "extra tok"
+
+    filter_.filter(record)
+
+    assert record.getMessage() == "key=[redacted] then [redacted], [redacted]"
+    assert record.detail == "extra [redacted]"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_formatter_emits_parseable_payload(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(logging_utils, "orjson", None)
+    record = logging.LogRecord(
+        name="remy.test.json",
+        level=logging.WARNING,
+        pathname=__file__,
+        lineno=0,
+        msg="crème brûlée for %d",
+        args=(4,),
+        exc_info=None,
+    )
+    record.created = 1_700_000_000.25
+    record.request_id = "req-1"
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload == {
+        "timestamp": "2023-11-14T22:13:20.250000+00:00",
+        "level": "WARNING",
+        "logger": "remy.test.json",
+        "message": "crème brûlée for 4",
+        "request_id": "req-1",
+    }
+
+
+def test_sensitive_data_filter_leaves_standard_attributes_alone():
+    filter_ = SensitiveDataFilter(["remy"])
+    record = logging.LogRecord(
+        name="remy.test.redaction",
+        level=logging.INFO,
+        pathname="/srv/remy/app.py",
+        lineno=0,
+        msg="hello remy",
+        args=(),
+        exc_info=None,
+    )
+    record.user = "remy-bot"
+
+    filter_.filter(record)
+
+    assert record.getMessage() == "hello [redacted]"
+    assert record.user == "[redacted]-bot"
+    assert record.name == "remy.test.redaction"
+    assert record.pathname == "/srv/remy/app.py"
+
+
+def test_sensitive_data_filter_prefilter_scans_whole_message():
+    filter_ = SensitiveDataFilter(["zq-secret"])
+    clean = "GET /api/inventory 200"
+    late = f"{'x' * 300} zq-secret {'y' * 300} BEARER abc"
+    assert filter_._scrub(clean) is clean
+    assert _mask_known_patterns(clean) is clean
+    assert filter_._scrub(_mask_known_patterns(late)) == f"{'x' * 300} [redacted] {'y' * 300} BEARER [redacted]"
@@ -12,3 +12,17 @@ def test_generate_plan_returns_plan() -> None:
 
     assert plan.date == context.date
     assert isinstance(plan.candidates, list)
+
+
+def test_agents_package_resolves_lazily() -> None:
+    import subprocess
+    import sys
+
+    script = (
+        "import sys, remy.agents as agents; "
+        "assert 'remy.agents.receipt_ingestor' not in sys.modules; "
+        "from remy.agents import DiffValidator; "
+        "assert DiffValidator.__module__ == 'remy.agents.diff_validator'; "
+        "assert set(agents.__all__) <= set(dir(agents))"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)